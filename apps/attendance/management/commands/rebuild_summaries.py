@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from datetime import datetime
+
+from apps.attendance.models import CheckIn, AttendanceSummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily attendance summaries from existing check-in records'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start-date',
+            type=str,
+            help='Only rebuild summaries from this date on, in YYYY-MM-DD format (default: all check-ins)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows per INSERT when writing summaries (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        checkins = CheckIn.objects.all()
+
+        if options['start_date']:
+            try:
+                start_date = datetime.strptime(options['start_date'], '%Y-%m-%d').date()
+            except ValueError:
+                self.stdout.write(self.style.ERROR('Invalid start date format. Use YYYY-MM-DD'))
+                return
+            checkins = checkins.filter(timestamp__date__gte=start_date)
+
+        self.stdout.write('Rebuilding attendance summaries from check-ins...')
+
+        with transaction.atomic():
+            total_summaries = AttendanceSummary.rebuild(checkins, batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully rebuilt {total_summaries} attendance summaries.'))
@@ -18,8 +18,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing attendance group memberships before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing attendance group memberships...'))
             AttendanceGroupMembership.objects.all().delete()
@@ -77,6 +85,14 @@ class Command(BaseCommand):
                     hr_managers_by_company[company_id] = []
                 hr_managers_by_company[company_id].append(hr_manager)
         
+        # Active HR manager assignments that already exist, so a re-run doesn't
+        # assign (or report assigning) a manager to the same group twice
+        existing_hr_assignments = set(
+            AttendanceGroupMembership.objects.filter(
+                employee__in=hr_managers, is_active=True
+            ).values_list('employee_id', 'attendance_group_id')
+        )
+        
         # Process each company separately
         for company in companies:
             company_groups = groups.filter(company=company).order_by('branch_id', 'id')
@@ -101,7 +117,7 @@ class Command(BaseCommand):
                         employee = company_employees[employee_idx]
                         
                         # Create attendance group membership
-                        assignment = AttendanceGroupMembership.objects.create(
+                        assignment = AttendanceGroupMembership(
                             employee=employee,
                             attendance_group=group,
                             is_active=True
@@ -120,14 +136,9 @@ class Command(BaseCommand):
                     hr_manager = company_hr_managers[hr_manager_idx % len(company_hr_managers)]
                     
                     # Check if HR manager is already assigned to this group
-                    existing_assignment = AttendanceGroupMembership.objects.filter(
-                        employee=hr_manager,
-                        attendance_group=group,
-                        is_active=True
-                    ).first()
-                    
-                    if not existing_assignment:
-                        assignment = AttendanceGroupMembership.objects.create(
+                    if (hr_manager.id, group.id) not in existing_hr_assignments:
+                        existing_hr_assignments.add((hr_manager.id, group.id))
+                        assignment = AttendanceGroupMembership(
                             employee=hr_manager,
                             attendance_group=group,
                             is_active=True
@@ -142,6 +153,8 @@ class Command(BaseCommand):
                 if len(company_hr_managers) > 0:
                     hr_manager_idx += 1
         
+        AttendanceGroupMembership.objects.bulk_create(assignments, batch_size=self.batch_size)
+        
         return assignments
 
     def get_assignment_summary(self):
@@ -1,12 +1,14 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.utils import timezone
 from datetime import datetime, timedelta, time
 from decimal import Decimal
 import random
 from faker import Faker
 
-from apps.attendance.models import CheckIn, AttendanceGroup, Period, AttendanceGroupMembership
+from apps.attendance.models import CheckIn, AttendanceGroup, Period, AttendanceGroupMembership, AttendanceSummary
+from apps.core.management.bulk import insert_rows
 
 User = get_user_model()
 fake = Faker()
@@ -31,11 +33,23 @@ class Command(BaseCommand):
             type=str,
             help='Start date in YYYY-MM-DD format (default: 30 days ago)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write('Clearing existing check-in records...')
-            CheckIn.objects.all().delete()
+            AttendanceSummary.objects.all().delete()
+            # With the summaries gone there is nothing for the per-row delete
+            # signals to update, so delete the check-ins in one statement
+            checkins = CheckIn.objects.all()
+            checkins._raw_delete(checkins.db)
             self.stdout.write(self.style.SUCCESS('Existing check-in records cleared.'))
 
         # Determine date range
@@ -62,6 +76,7 @@ class Command(BaseCommand):
 
         total_checkins = 0
         companies_processed = set()
+        pending_checkins = []
 
         # Process each assignment
         for assignment in assignments:
@@ -107,27 +122,58 @@ class Command(BaseCommand):
                 checkins_today = self.generate_daily_attendance(
                     employee, group, period, current_date
                 )
-                employee_checkins += checkins_today
-                total_checkins += checkins_today
+                pending_checkins.extend(checkins_today)
+                employee_checkins += len(checkins_today)
+                total_checkins += len(checkins_today)
+
+                # Flush full batches so memory stays bounded on long date ranges
+                if len(pending_checkins) >= self.batch_size:
+                    self.flush_checkins(pending_checkins)
 
                 current_date += timedelta(days=1)
 
             self.stdout.write(f'  Generated {employee_checkins} check-ins for {employee.get_full_name()}')
 
+        self.flush_checkins(pending_checkins)
+        total_summaries = self.build_summaries(start_date)
+
         # Display summary
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nSuccessfully generated {total_checkins} check-in records:\n'
                 f'  - Date range: {start_date} to {end_date}\n'
                 f'  - Companies processed: {len(companies_processed)}\n'
+                f'  - Daily summaries: {total_summaries}\n'
                 f'  - Employee assignments: {assignments.count()}\n'
                 f'  - Average check-ins per employee: {total_checkins / assignments.count():.1f}'
             )
         )
 
+    def flush_checkins(self, pending_checkins):
+        """Insert the accumulated check-in records and empty the buffer"""
+        # Raw INSERTs keep the generated timestamps, which bulk_create's
+        # auto_now_add would overwrite with the current time
+        fields = [field for field in CheckIn._meta.concrete_fields if not field.primary_key]
+        rows = [
+            tuple(field.get_db_prep_save(getattr(checkin, field.attname), connection) for field in fields)
+            for checkin in pending_checkins
+        ]
+        insert_rows(CheckIn, [field.column for field in fields], rows, self.batch_size)
+        pending_checkins.clear()
+
+    def build_summaries(self, start_date):
+        """Materialize daily attendance summaries for check-ins since start_date"""
+        # bulk_create skips the post_save signal that keeps summaries in sync,
+        # so rebuild them here in one pass over the check-ins
+        AttendanceSummary.objects.filter(date__gte=start_date).delete()
+        return AttendanceSummary.rebuild(
+            CheckIn.objects.filter(timestamp__date__gte=start_date),
+            batch_size=self.batch_size
+        )
+
     def generate_daily_attendance(self, employee, group, period, date):
-        """Generate check-in and check-out records for a single day"""
-        checkins_created = 0
+        """Generate unsaved check-in and check-out records for a single day"""
+        records = []
         
         # Generate realistic arrival time (with some variation)
         base_checkin_time = period.start_time
@@ -148,8 +194,7 @@ class Command(BaseCommand):
         # Generate location near the group location (within radius)
         checkin_lat, checkin_lon = self.generate_location_near_group(group)
 
-        # Create check-in record with explicit timestamp
-        # Use bulk_create to bypass auto_now_add and model validation
+        # Build check-in record with explicit timestamp
         checkin = CheckIn(
             employee=employee,
             attendance_group=group,
@@ -165,9 +210,7 @@ class Command(BaseCommand):
             created_at=checkin_datetime,
             updated_at=checkin_datetime
         )
-        # Save without calling the model's save method to avoid timestamp issues
-        CheckIn.objects.bulk_create([checkin])
-        checkins_created += 1
+        records.append(checkin)
 
         # Generate check-out (80% of the time - sometimes people forget)
         if random.random() <= 0.8:
@@ -188,8 +231,7 @@ class Command(BaseCommand):
             # Generate location (might be slightly different from check-in)
             checkout_lat, checkout_lon = self.generate_location_near_group(group)
 
-            # Create check-out record with explicit timestamp
-            # Use bulk_create to bypass auto_now_add and model validation
+            # Build check-out record with explicit timestamp
             checkout = CheckIn(
                 employee=employee,
                 attendance_group=group,
@@ -205,11 +247,9 @@ class Command(BaseCommand):
                 created_at=checkout_datetime,
                 updated_at=checkout_datetime
             )
-            # Save without calling the model's save method to avoid timestamp issues
-            CheckIn.objects.bulk_create([checkout])
-            checkins_created += 1
+            records.append(checkout)
 
-        return checkins_created
+        return records
 
     def generate_location_near_group(self, group):
         """Generate a random location within the group's radius"""
@@ -16,8 +16,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing attendance groups before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing attendance groups...'))
             AttendanceGroup.objects.all().delete()
@@ -128,7 +136,7 @@ class Command(BaseCommand):
                 group_lat = float(branch.latitude) + group_data['latitude_offset']
                 group_lon = float(branch.longitude) + group_data['longitude_offset']
                 
-                group = AttendanceGroup.objects.create(
+                groups.append(AttendanceGroup(
                     name=group_data['name'],
                     company=branch.company,
                     branch=branch,
@@ -136,14 +144,15 @@ class Command(BaseCommand):
                     latitude=group_lat,
                     longitude=group_lon,
                     radius=group_data['radius']
-                )
-                
-                groups.append(group)
-                self.stdout.write(
-                    f'Created Attendance Group: {group.name} '
-                    f'({branch.company.name} - {branch.name}) '
-                    f'at ({group_lat:.6f}, {group_lon:.6f}) with {group_data["radius"]}m radius'
-                )
+                ))
+        
+        AttendanceGroup.objects.bulk_create(groups, batch_size=self.batch_size)
+        for group in groups:
+            self.stdout.write(
+                f'Created Attendance Group: {group.name} '
+                f'({group.company.name} - {group.branch.name}) '
+                f'at ({group.latitude:.6f}, {group.longitude:.6f}) with {group.radius}m radius'
+            )
         
         return groups
 
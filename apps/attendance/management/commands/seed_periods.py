@@ -15,8 +15,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing periods before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing periods...'))
             Period.objects.all().delete()
@@ -148,7 +156,7 @@ class Command(BaseCommand):
             
             # Create both periods for this group
             for period_key, period_data in period_template.items():
-                period = Period.objects.create(
+                periods.append(Period(
                     name=period_data['name'],
                     group=group,
                     start_time=period_data['start_time'],
@@ -156,13 +164,14 @@ class Command(BaseCommand):
                     weekdays=period_data['weekdays'],
                     late_checkin_grace_minutes=period_data['late_checkin_grace_minutes'],
                     early_checkout_grace_minutes=period_data['early_checkout_grace_minutes']
-                )
-                
-                periods.append(period)
-                self.stdout.write(
-                    f'Created Period: {period.name} for {group.name} '
-                    f'({period.start_time} - {period.end_time}, {self.get_weekday_names(period.weekdays)})'
-                )
+                ))
+        
+        Period.objects.bulk_create(periods, batch_size=self.batch_size)
+        for period in periods:
+            self.stdout.write(
+                f'Created Period: {period.name} for {period.group.name} '
+                f'({period.start_time} - {period.end_time}, {self.get_weekday_names(period.weekdays)})'
+            )
         
         return periods
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancesummary',
+            index=models.Index(fields=['employee', 'date'], name='attendance__employe_aeb60a_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_add_attendancesummary_employee_date_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancegroupmembership',
+            index=models.Index(fields=['attendance_group', 'is_active'], name='attendance__attenda_4439ad_idx'),
+        ),
+    ]
@@ -152,6 +152,9 @@ class AttendanceGroupMembership(models.Model):
                 condition=models.Q(is_active=True)
             )
         ]
+        indexes = [
+            models.Index(fields=['attendance_group', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.employee.username} in {self.attendance_group.name}"
@@ -466,11 +469,141 @@ class AttendanceSummary(models.Model):
                 name='unique_daily_attendance_summary'
             )
         ]
+        indexes = [
+            models.Index(fields=['employee', 'date']),
+        ]
         ordering = ['-date', 'employee']
     
     def __str__(self):
         return f"{self.employee.username} - {self.date} ({self.total_hours}h)"
     
+    @staticmethod
+    def summarize_checkins(checkins):
+        """
+        Compute summary fields from a single day's check-ins.
+        Args:
+            checkins: list of CheckIn records for one employee, group and day, ordered by timestamp
+        Returns:
+            dict: field values for an AttendanceSummary
+        """
+        first_checkin = next(
+            (checkin for checkin in checkins if checkin.type == CheckIn.CheckInType.CHECK_IN), None
+        )
+        last_checkout = next(
+            (checkin for checkin in reversed(checkins) if checkin.type == CheckIn.CheckInType.CHECK_OUT), None
+        )
+        
+        # Pair consecutive check-in/check-out records
+        total_hours = 0
+        for i in range(0, len(checkins) - 1, 2):
+            check_in = checkins[i]
+            check_out = checkins[i + 1]
+            if check_in.type == CheckIn.CheckInType.CHECK_IN and check_out.type == CheckIn.CheckInType.CHECK_OUT:
+                duration = check_out.timestamp - check_in.timestamp
+                total_hours += duration.total_seconds() / 3600
+        
+        return {
+            'first_checkin': first_checkin,
+            'last_checkout': last_checkout,
+            'total_hours': round(total_hours, 2),
+            'total_checkins': sum(1 for checkin in checkins if checkin.type == CheckIn.CheckInType.CHECK_IN),
+            'is_present': bool(checkins),
+            'is_late': first_checkin is not None and first_checkin.status == CheckIn.CheckInStatus.LATE,
+        }
+    
+    @classmethod
+    def update_for_days(cls, keys):
+        """
+        Recompute the summaries for a set of (employee_id, attendance_group_id, date) keys
+        from their check-ins, dropping those with no check-ins left.
+        Runs a fixed number of queries however many keys are given.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+        
+        employee_ids = {employee_id for employee_id, _, _ in keys}
+        attendance_group_ids = {attendance_group_id for _, attendance_group_id, _ in keys}
+        dates = {date for _, _, date in keys}
+        
+        # Every employee, group and date combination is refreshed, a superset of
+        # the keys given; summaries outside the keys are recomputed unchanged
+        cls.rebuild(CheckIn.objects.filter(
+            employee_id__in=employee_ids,
+            attendance_group_id__in=attendance_group_ids,
+            timestamp__date__in=dates
+        ))
+        cls.objects.filter(
+            employee_id__in=employee_ids,
+            attendance_group_id__in=attendance_group_ids,
+            date__in=dates
+        ).filter(
+            ~models.Exists(CheckIn.objects.filter(
+                employee_id=models.OuterRef('employee_id'),
+                attendance_group_id=models.OuterRef('attendance_group_id'),
+                timestamp__date=models.OuterRef('date')
+            ))
+        ).delete()
+    
+    @classmethod
+    def rebuild(cls, checkins, batch_size=1000):
+        """
+        Recompute the summaries for every employee, group and day the given check-ins cover.
+        Missing summaries are inserted and existing ones refreshed in place.
+        Args:
+            checkins: CheckIn queryset to summarize
+            batch_size: rows per INSERT and check-ins fetched per round trip
+        Returns:
+            int: number of summaries written
+        """
+        summary_fields = [
+            'first_checkin', 'last_checkout', 'total_hours', 'total_checkins',
+            'is_present', 'is_late', 'updated_at'
+        ]
+        summaries = []
+        written = 0
+        
+        def flush():
+            nonlocal written
+            cls.objects.bulk_create(
+                summaries,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['employee', 'attendance_group', 'date'],
+                update_fields=summary_fields
+            )
+            written += len(summaries)
+            summaries.clear()
+        
+        def add_summary(key, day_checkins):
+            employee_id, attendance_group_id, date = key
+            summaries.append(cls(
+                employee_id=employee_id,
+                attendance_group_id=attendance_group_id,
+                date=date,
+                **cls.summarize_checkins(day_checkins)
+            ))
+            if len(summaries) >= batch_size:
+                flush()
+        
+        # Each employee and group's check-ins arrive in time order, so every
+        # day's check-ins are contiguous and can be summarized in one pass
+        day_key = None
+        day_checkins = []
+        ordered_checkins = checkins.order_by('employee_id', 'attendance_group_id', 'timestamp')
+        for checkin in ordered_checkins.iterator(chunk_size=batch_size):
+            key = (checkin.employee_id, checkin.attendance_group_id, timezone.localdate(checkin.timestamp))
+            if key != day_key and day_checkins:
+                add_summary(day_key, day_checkins)
+                day_checkins = []
+            day_key = key
+            day_checkins.append(checkin)
+        
+        if day_checkins:
+            add_summary(day_key, day_checkins)
+        flush()
+        return written
+    
     @property
     def company(self):
         """Get the company this summary belongs to"""
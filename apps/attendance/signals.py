@@ -0,0 +1,89 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import CheckIn, AttendanceSummary
+
+
+def summary_key(employee_id, attendance_group_id, timestamp):
+    """The (employee, group, day) whose AttendanceSummary a check-in counts towards"""
+    return employee_id, attendance_group_id, timezone.localdate(timestamp)
+
+
+class CommitBatch:
+    """
+    Items collected while a transaction runs and handed to flush together
+    once it commits, so bulk and cascading changes do their follow-up work
+    once instead of once per row
+    """
+    
+    def __init__(self, flush):
+        self.flush = flush
+        self.attr = f'commit_batch_{id(self)}'
+    
+    def add(self, *items):
+        connection = transaction.get_connection()
+        pending = getattr(connection, self.attr, None)
+        # Reuse the batch only while its callback is still waiting: a commit
+        # runs it and a rollback discards it. Outside a transaction the callback
+        # runs straight away and is never registered.
+        if pending is not None and any(callback is pending[0] for _, callback, _ in connection.run_on_commit):
+            pending[1].update(items)
+            return
+        
+        batch = set(items)
+        
+        def run():
+            # Changes made after this point start a new batch
+            setattr(connection, self.attr, None)
+            self.flush(batch)
+        
+        setattr(connection, self.attr, (run, batch))
+        transaction.on_commit(run)
+
+
+def update_summaries(keys):
+    """Recompute the summaries for the (employee, group, day) keys a transaction touched"""
+    with transaction.atomic():
+        AttendanceSummary.update_for_days(keys)
+
+
+summary_updates = CommitBatch(update_summaries)
+
+
+@receiver(pre_save, sender=CheckIn)
+def remember_previous_summary_key(sender, instance, **kwargs):
+    """Record which summary an existing check-in counted towards before it is edited"""
+    instance._previous_summary_key = None
+    if kwargs.get('raw') or instance._state.adding or instance.pk is None:
+        return
+    previous = CheckIn.objects.filter(pk=instance.pk).values_list(
+        'employee_id', 'attendance_group_id', 'timestamp'
+    ).first()
+    if previous is not None:
+        instance._previous_summary_key = summary_key(*previous)
+
+
+@receiver(post_save, sender=CheckIn)
+def update_attendance_summary(sender, instance, **kwargs):
+    """Keep the daily AttendanceSummary in sync with the employee's check-ins"""
+    if kwargs.get('raw'):
+        return
+    key = summary_key(instance.employee_id, instance.attendance_group_id, instance.timestamp)
+    
+    # An edit that moved the check-in to another day, group or employee also
+    # changes the summary it used to count towards
+    previous_key = getattr(instance, '_previous_summary_key', None)
+    if previous_key is not None and previous_key != key:
+        summary_updates.add(key, previous_key)
+    else:
+        summary_updates.add(key)
+
+
+@receiver(post_delete, sender=CheckIn)
+def remove_from_attendance_summary(sender, instance, **kwargs):
+    """Recompute, or drop once empty, the summary a deleted check-in counted towards"""
+    summary_updates.add(
+        summary_key(instance.employee_id, instance.attendance_group_id, instance.timestamp)
+    )
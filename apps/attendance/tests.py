@@ -1,3 +1,124 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+
+from apps.companies.models import Company
+from .models import AttendanceGroup, AttendanceSummary, CheckIn
+
+User = get_user_model()
+
+
+class AttendanceSummaryTests(TestCase):
+    """Summaries follow check-ins as they are created, moved, deleted and rebuilt"""
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create_user(username='owner', password='owner123')
+        company = Company.objects.create(name='Test Company', owner=owner)
+        cls.employee = User.objects.create_user(username='employee', password='employee123', company=company)
+        cls.group = AttendanceGroup.objects.create(
+            name='Head Office', company=company, latitude='24.713600', longitude='46.675300'
+        )
+        cls.other_group = AttendanceGroup.objects.create(
+            name='Warehouse', company=company, latitude='24.774300', longitude='46.738600'
+        )
+        cls.day = timezone.localdate() - timedelta(days=3)
+
+    def at(self, hour, day=None):
+        """Aware datetime at the given hour of the test day"""
+        return timezone.make_aware(datetime.combine(day or self.day, datetime.min.time()) + timedelta(hours=hour))
+
+    def record(self, type, timestamp, group=None):
+        """Create a check-in at the given time, letting its summary update as on commit"""
+        with self.captureOnCommitCallbacks(execute=True):
+            checkin = CheckIn.objects.create(
+                employee=self.employee,
+                attendance_group=group or self.group,
+                latitude='24.713600',
+                longitude='46.675300',
+                type=type,
+            )
+            # timestamp is auto_now_add, so the wanted time is set by a second save
+            checkin.timestamp = timestamp
+            checkin.save()
+        return checkin
+
+    def summary(self, group=None, day=None):
+        return AttendanceSummary.objects.filter(
+            employee=self.employee, attendance_group=group or self.group, date=day or self.day
+        ).first()
+
+    def test_creating_checkins_writes_summary(self):
+        checkin = self.record(CheckIn.CheckInType.CHECK_IN, self.at(9))
+        checkout = self.record(CheckIn.CheckInType.CHECK_OUT, self.at(17))
+
+        summary = self.summary()
+        self.assertIsNotNone(summary)
+        self.assertEqual(summary.first_checkin, checkin)
+        self.assertEqual(summary.last_checkout, checkout)
+        self.assertEqual(summary.total_checkins, 1)
+        self.assertEqual(float(summary.total_hours), 8.0)
+        self.assertTrue(summary.is_present)
+        # Only the test day has check-ins once the timestamps are set
+        self.assertEqual(AttendanceSummary.objects.count(), 1)
+
+    def test_moving_checkin_to_another_day_updates_both_summaries(self):
+        self.record(CheckIn.CheckInType.CHECK_IN, self.at(9))
+        checkout = self.record(CheckIn.CheckInType.CHECK_OUT, self.at(17))
+        next_day = self.day + timedelta(days=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            checkout.timestamp = self.at(17, next_day)
+            checkout.save()
+
+        old_summary = self.summary()
+        self.assertIsNone(old_summary.last_checkout)
+        self.assertEqual(float(old_summary.total_hours), 0)
+        new_summary = self.summary(day=next_day)
+        self.assertEqual(new_summary.last_checkout, checkout)
+        self.assertEqual(new_summary.total_checkins, 0)
+
+    def test_moving_checkin_to_another_group_updates_both_summaries(self):
+        checkin = self.record(CheckIn.CheckInType.CHECK_IN, self.at(9))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            checkin.attendance_group = self.other_group
+            checkin.save()
+
+        self.assertIsNone(self.summary())
+        self.assertEqual(self.summary(group=self.other_group).first_checkin, checkin)
+
+    def test_deleting_last_checkin_of_day_removes_summary(self):
+        checkin = self.record(CheckIn.CheckInType.CHECK_IN, self.at(9))
+        checkout = self.record(CheckIn.CheckInType.CHECK_OUT, self.at(17))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            checkout.delete()
+        self.assertEqual(self.summary().first_checkin, checkin)
+        self.assertIsNone(self.summary().last_checkout)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CheckIn.objects.filter(pk=checkin.pk).delete()
+        self.assertIsNone(self.summary())
+
+    def test_rebuild_is_idempotent(self):
+        self.record(CheckIn.CheckInType.CHECK_IN, self.at(9))
+        self.record(CheckIn.CheckInType.CHECK_OUT, self.at(12))
+        self.record(CheckIn.CheckInType.CHECK_IN, self.at(13))
+        self.record(CheckIn.CheckInType.CHECK_OUT, self.at(17, self.day + timedelta(days=1)))
+        self.record(CheckIn.CheckInType.CHECK_IN, self.at(8), group=self.other_group)
+        fields = ['employee_id', 'attendance_group_id', 'date', 'first_checkin_id', 'last_checkout_id',
+                  'total_hours', 'total_checkins', 'is_present', 'is_late']
+        expected = list(AttendanceSummary.objects.order_by('attendance_group_id', 'date').values_list(*fields))
+
+        AttendanceSummary.objects.all().delete()
+        self.assertEqual(AttendanceSummary.rebuild(CheckIn.objects.all()), 3)
+        first = list(AttendanceSummary.objects.order_by('attendance_group_id', 'date').values_list(*fields))
+        self.assertEqual(AttendanceSummary.rebuild(CheckIn.objects.all()), 3)
+        second = list(AttendanceSummary.objects.order_by('attendance_group_id', 'date').values_list(*fields))
 
-# Create your tests here.
+        self.assertEqual(first, expected)
+        self.assertEqual(second, first)
+        self.assertEqual(AttendanceSummary.objects.count(), 3)
@@ -14,8 +14,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing branches before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing branches...'))
             Branch.objects.all().delete()
@@ -100,7 +108,7 @@ class Command(BaseCommand):
             company_branches = branch_templates[company_idx]
             
             for branch_data in company_branches:
-                branch = Branch.objects.create(
+                branches.append(Branch(
                     name=branch_data['name'],
                     company=company,
                     code=branch_data['code'],
@@ -110,10 +118,11 @@ class Command(BaseCommand):
                     latitude=branch_data['latitude'],
                     longitude=branch_data['longitude'],
                     radius=branch_data['radius']
-                )
-                
-                branches.append(branch)
-                self.stdout.write(f'Created Branch: {branch.name} ({company.name})')
+                ))
+        
+        Branch.objects.bulk_create(branches, batch_size=self.batch_size)
+        for branch in branches:
+            self.stdout.write(f'Created Branch: {branch.name} ({branch.company.name})')
         
         return branches
 
@@ -16,8 +16,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing companies before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing companies...'))
             Company.objects.all().delete()
@@ -47,6 +55,7 @@ class Command(BaseCommand):
     def create_companies(self, owners):
         """Create 2 companies with their respective owners"""
         companies = []
+        owners = list(owners)
         
         company_data = [
             {
@@ -74,7 +83,7 @@ class Command(BaseCommand):
         ]
         
         for i, data in enumerate(company_data):
-            company = Company.objects.create(
+            companies.append(Company(
                 name=data['name'],
                 description=data['description'],
                 website=data['website'],
@@ -85,15 +94,18 @@ class Command(BaseCommand):
                 max_employees=data['max_employees'],
                 default_radius=data['default_radius'],
                 owner=owners[i]
-            )
-            
-            # Update the owner's company field
-            owner = owners[i]
-            owner.company = company
-            owner.save()
-            
-            companies.append(company)
-            self.stdout.write(f'Created Company: {company.name} (Owner: {owner.get_full_name()})')
+            ))
+        
+        # Primary keys are needed to link owners back, so conflicts are not ignored here
+        Company.objects.bulk_create(companies, batch_size=self.batch_size)
+        
+        # Update the owners' company field
+        for company in companies:
+            company.owner.company = company
+        User.objects.bulk_update([company.owner for company in companies], ['company'], batch_size=self.batch_size)
+        
+        for company in companies:
+            self.stdout.write(f'Created Company: {company.name} (Owner: {company.owner.get_full_name()})')
         
         return companies
 
@@ -16,8 +16,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing departments before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing departments and memberships...'))
             DepartmentMembership.objects.all().delete()
@@ -81,15 +89,19 @@ class Command(BaseCommand):
             ['Laboratory', 'Product Development']
         ]
         
+        hr_managers = list(hr_managers)
+        employees = list(employees)
         hr_manager_idx = 0
         employee_idx = 0
         
+        # (department, hr_manager, assigned employees) for each department, in creation order
+        assignments = []
+        
         for branch_idx, branch in enumerate(branches):
             branch_departments = department_templates[branch_idx]
             
             for dept_name in branch_departments:
-                # Create department
-                department = Department.objects.create(
+                department = Department(
                     name=dept_name,
                     branch=branch,
                     code=f"{branch.code}-{dept_name[:3].upper()}",
@@ -100,40 +112,50 @@ class Command(BaseCommand):
                 hr_manager = hr_managers[hr_manager_idx]
                 hr_manager.managed_branch = branch  # Set the managed branch
                 hr_manager.company = branch.company  # Set the company
-                hr_manager.save()
-                
-                # Create HR manager membership
-                DepartmentMembership.objects.create(
-                    employee=hr_manager,
-                    department=department,
-                    position='HR Manager',
-                    is_active=True
-                )
                 
                 # Assign 2 employees to this department
-                for i in range(2):
-                    employee = employees[employee_idx]
+                department_employees = employees[employee_idx:employee_idx + 2]
+                for employee in department_employees:
                     employee.company = branch.company  # Set the company
-                    employee.save()
-                    
-                    # Create employee membership
-                    DepartmentMembership.objects.create(
-                        employee=employee,
-                        department=department,
-                        position=f'{dept_name} Specialist',
-                        is_active=True
-                    )
-                    
-                    employee_idx += 1
+                employee_idx += 2
                 
                 departments.append(department)
-                self.stdout.write(
-                    f'Created Department: {department.name} ({branch.company.name} - {branch.name}) '
-                    f'with HR Manager: {hr_manager.get_full_name()} and 2 employees'
-                )
-                
+                assignments.append((department, hr_manager, department_employees))
                 hr_manager_idx += 1
         
+        # Primary keys are needed for the memberships below, so conflicts are not ignored here
+        Department.objects.bulk_create(departments, batch_size=self.batch_size)
+        User.objects.bulk_update(
+            hr_managers[:hr_manager_idx], ['managed_branch', 'company'], batch_size=self.batch_size
+        )
+        User.objects.bulk_update(employees[:employee_idx], ['company'], batch_size=self.batch_size)
+        
+        memberships = []
+        for department, hr_manager, department_employees in assignments:
+            # Create HR manager membership
+            memberships.append(DepartmentMembership(
+                employee=hr_manager,
+                department=department,
+                position='HR Manager',
+                is_active=True
+            ))
+            
+            # Create employee memberships
+            for employee in department_employees:
+                memberships.append(DepartmentMembership(
+                    employee=employee,
+                    department=department,
+                    position=f'{department.name} Specialist',
+                    is_active=True
+                ))
+            
+            self.stdout.write(
+                f'Created Department: {department.name} ({department.branch.company.name} - {department.branch.name}) '
+                f'with HR Manager: {hr_manager.get_full_name()} and {len(department_employees)} employees'
+            )
+        
+        DepartmentMembership.objects.bulk_create(memberships, batch_size=self.batch_size)
+        
         return departments
 
     def get_department_summary(self):
@@ -20,7 +20,7 @@ User = get_user_model()
 # Permission decorators
 def company_manager_required(user):
     """Check if user is a company manager or super admin"""
-    return user.is_authenticated and user.role in [UserRole.COMPANY_MANAGER, UserRole.SUPER_ADMIN]
+    return user.is_authenticated and user.can_manage_company
 
 def company_owner_required(user):
     """Check if user owns the company or is super admin"""
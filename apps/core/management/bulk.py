@@ -0,0 +1,37 @@
+from django.core.management.color import no_style
+from django.db import connection
+
+
+def insert_rows(model, columns, rows, batch_size):
+    """
+    Insert row tuples with multi-row INSERT statements, skipping model instantiation.
+    Values are written as given: auto_now/auto_now_add and save signals don't run.
+    Args:
+        model: model whose table the rows go into
+        columns: column names, in the order of each row's values
+        rows: tuples of database-ready values
+        batch_size: maximum rows per INSERT
+    """
+    quote_name = connection.ops.quote_name
+    insert_sql = 'INSERT INTO {} ({}) VALUES '.format(
+        quote_name(model._meta.db_table),
+        ', '.join(quote_name(column) for column in columns)
+    )
+    row_placeholder = '({})'.format(', '.join(['%s'] * len(columns)))
+    
+    # Keep each statement under the backend's query parameter limit
+    fields = [model._meta.get_field(column) for column in columns]
+    batch_size = min(batch_size, connection.ops.bulk_batch_size(fields, rows) or batch_size)
+    
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            cursor.execute(
+                insert_sql + ', '.join([row_placeholder] * len(batch)),
+                [value for row in batch for value in row]
+            )
+        
+        # Explicit ids don't advance the primary key sequence on PostgreSQL
+        if 'id' in columns:
+            for reset_sql in connection.ops.sequence_reset_sql(no_style(), [model]):
+                cursor.execute(reset_sql)
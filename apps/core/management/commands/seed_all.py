@@ -1,9 +1,9 @@
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from django.db import transaction
+from django.db import connection, transaction
 from django.contrib.auth import get_user_model
 from apps.companies.models import Company, Branch, Department, DepartmentMembership
-from apps.attendance.models import AttendanceGroup, Period, AttendanceGroupMembership, CheckIn
+from apps.attendance.models import AttendanceGroup, AttendanceGroupMembership
 
 User = get_user_model()
 
@@ -21,6 +21,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip user seeding (use existing users)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows per INSERT for bulk operations, forwarded to every seeder (default: 5000)',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(
@@ -46,17 +52,23 @@ class Command(BaseCommand):
             ('seed_checkins', 'Attendance Records (Check-ins/Check-outs)', True),
         ]
 
-        for command, description, should_run in seeder_sequence:
-            if should_run:
-                self.stdout.write(f'\nSeeding {description}...')
-                try:
-                    call_command(command, '--clear')
-                    self.stdout.write(self.style.SUCCESS(f'SUCCESS: {description} seeded successfully'))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f'ERROR: Error seeding {description}: {str(e)}'))
-                    return
-            else:
-                self.stdout.write(f'\nSkipping {description}')
+        # Seed everything in one transaction so the run commits once; sub-commands
+        # run in-process, so their own atomic blocks become savepoints of this one
+        with transaction.atomic():
+            for command, description, should_run in seeder_sequence:
+                if should_run:
+                    self.stdout.write(f'\nSeeding {description}...')
+                    try:
+                        # Every seeder accepts --batch-size and passes it to bulk_create()
+                        call_command(command, '--clear', f'--batch-size={options["batch_size"]}')
+                        self.stdout.write(self.style.SUCCESS(f'SUCCESS: {description} seeded successfully'))
+                    except Exception as e:
+                        self.stdout.write(self.style.ERROR(f'ERROR: Error seeding {description}: {str(e)}'))
+                        # Discard the partially seeded data from earlier steps
+                        transaction.set_rollback(True)
+                        return
+                else:
+                    self.stdout.write(f'\nSkipping {description}')
 
         # Display final summary
         self.display_final_summary()
@@ -79,7 +91,9 @@ class Command(BaseCommand):
             
             for command in clear_commands:
                 try:
-                    call_command(command, '--clear')
+                    # Each clear runs in its own transaction, outside the seeding block
+                    with transaction.atomic():
+                        call_command(command, '--clear')
                 except Exception as e:
                     self.stdout.write(self.style.WARNING(f'Warning clearing {command}: {str(e)}'))
                     # Continue with other commands
@@ -99,30 +113,44 @@ class Command(BaseCommand):
             )
         )
 
-        # Count all entities
+        # Count all entities in a single round trip
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT 'users', COUNT(*) FROM users_customuser
+                UNION ALL SELECT role, COUNT(*) FROM users_customuser GROUP BY role
+                UNION ALL SELECT 'companies', COUNT(*) FROM companies_company
+                UNION ALL SELECT 'branches', COUNT(*) FROM companies_branch
+                UNION ALL SELECT 'departments', COUNT(*) FROM companies_department
+                UNION ALL SELECT 'groups', COUNT(*) FROM attendance_attendancegroup
+                UNION ALL SELECT 'periods', COUNT(*) FROM attendance_period
+                UNION ALL SELECT 'assignments', COUNT(*) FROM attendance_attendancegroupmembership WHERE is_active
+                UNION ALL SELECT 'checkins', COUNT(*) FROM attendance_checkin
+                UNION ALL SELECT 'checkins_in', COUNT(*) FROM attendance_checkin WHERE type = 'IN'
+                UNION ALL SELECT 'checkins_out', COUNT(*) FROM attendance_checkin WHERE type = 'OUT'
+            """)
+            counts = dict(cursor.fetchall())
+
         users = User.objects.all()
         companies = Company.objects.all()
         branches = Branch.objects.all()
         departments = Department.objects.all()
         groups = AttendanceGroup.objects.all()
-        periods = Period.objects.all()
         assignments = AttendanceGroupMembership.objects.filter(is_active=True)
-        checkins = CheckIn.objects.all()
 
         summary = f"""
 DATA SUMMARY:
-+-- Users: {users.count()} total
-|   +-- Super Admins: {users.filter(role='SUPER_ADMIN').count()}
-|   +-- Company Managers: {users.filter(role='COMPANY_MANAGER').count()}
-|   +-- HR Employees: {users.filter(role='HR_EMPLOYEE').count()}
-|   +-- Employees: {users.filter(role='EMPLOYEE').count()}
-+-- Companies: {companies.count()}
-+-- Branches: {branches.count()} ({branches.count()//2} per company)
-+-- Departments: {departments.count()} ({departments.count()//4} per branch)
-+-- Attendance Groups: {groups.count()} ({groups.count()//4} per branch)
-+-- Work Periods: {periods.count()} ({periods.count()//8} per group)
-+-- Group Assignments: {assignments.count()}
-+-- Attendance Records: {checkins.count()} ({checkins.filter(type='IN').count()} check-ins, {checkins.filter(type='OUT').count()} check-outs)
++-- Users: {counts['users']} total
+|   +-- Super Admins: {counts.get('SUPER_ADMIN', 0)}
+|   +-- Company Managers: {counts.get('COMPANY_MANAGER', 0)}
+|   +-- HR Employees: {counts.get('HR_EMPLOYEE', 0)}
+|   +-- Employees: {counts.get('EMPLOYEE', 0)}
++-- Companies: {counts['companies']}
++-- Branches: {counts['branches']} ({counts['branches']//2} per company)
++-- Departments: {counts['departments']} ({counts['departments']//4} per branch)
++-- Attendance Groups: {counts['groups']} ({counts['groups']//4} per branch)
++-- Work Periods: {counts['periods']} ({counts['periods']//8} per group)
++-- Group Assignments: {counts['assignments']}
++-- Attendance Records: {counts['checkins']} ({counts['checkins_in']} check-ins, {counts['checkins_out']} check-outs)
 
 COMPANY BREAKDOWN:"""
 
@@ -5,3 +5,10 @@ class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.dashboard'
     verbose_name = 'Dashboard'
+    
+    def ready(self):
+        """Import signals when the app is ready"""
+        try:
+            import apps.dashboard.signals  # noqa F401
+        except ImportError:
+            pass
@@ -0,0 +1,34 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.attendance.models import CheckIn
+from apps.attendance.signals import CommitBatch
+from .views import dashboard_cache_key, recent_checkins_cache_key
+
+
+def invalidate_dashboard_caches(employee_ids):
+    """Drop the cached dashboard statistics and recent check-ins of the given employees"""
+    today = timezone.now().date()
+    cache.delete_many([
+        key
+        for employee_id in employee_ids
+        for key in (
+            dashboard_cache_key(employee_id, today, 'week'),
+            dashboard_cache_key(employee_id, today, 'month'),
+            recent_checkins_cache_key(employee_id),
+        )
+    ])
+
+
+dashboard_invalidations = CommitBatch(invalidate_dashboard_caches)
+
+
+@receiver(post_save, sender=CheckIn)
+@receiver(post_delete, sender=CheckIn)
+def invalidate_dashboard_stats(sender, instance, **kwargs):
+    """Drop the employee's cached dashboard statistics and recent check-ins when their check-ins change"""
+    # Invalidated after commit, so a bulk delete clears each employee once and
+    # no worker can re-cache the old numbers before the change is visible
+    dashboard_invalidations.add(instance.employee_id)
@@ -5,6 +5,7 @@ app_name = 'dashboard'
 
 urlpatterns = [
     path('', views.dashboard, name='dashboard'),
+    path('stats/', views.dashboard_stats, name='dashboard_stats'),
     path('profile/', views.profile, name='profile'),
     path('settings/', views.settings, name='settings'),
 ]
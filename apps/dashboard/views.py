@@ -1,193 +1,202 @@
 from django.shortcuts import render
+from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import datetime, timedelta
-from django.db.models import Count, Sum, Avg
-from apps.attendance.models import CheckIn, AttendanceSummary, AttendanceGroup, Period
-from apps.users.models import CustomUser
+from django.db.models import Count, Q, Sum
+from apps.attendance.models import CheckIn, AttendanceSummary, AttendanceGroup, AttendanceGroupMembership, Period
 
 
-@login_required
-def dashboard(request):
+DASHBOARD_CACHE_TIMEOUT = 60  # seconds
+RECENT_CHECKINS_CACHE_TIMEOUT = 30  # seconds
+RECENT_CHECKINS_LIMIT = 10
+
+
+def dashboard_cache_key(user_id, day, period):
     """
-    Main dashboard view showing attendance statistics and recent activity.
+    Cache key for a user's dashboard statistics on a given day.
+    """
+    return f'dash:{user_id}:{day.isoformat()}:{period}'
+
+
+def recent_checkins_cache_key(user_id):
+    """
+    Cache key for a user's most recent check-ins.
+    """
+    return f'recent_checkins:{user_id}'
+
+
+def get_recent_checkins(user, n=RECENT_CHECKINS_LIMIT):
+    """
+    The user's latest n check-ins (at most RECENT_CHECKINS_LIMIT), newest first.
+    One cached list per user serves both the dashboard and the profile page.
+    """
+    recent_checkins = cache.get_or_set(
+        recent_checkins_cache_key(user.id),
+        lambda: list(CheckIn.objects.filter(
+            employee=user
+        ).select_related('attendance_group').order_by('-timestamp')[:RECENT_CHECKINS_LIMIT]),
+        RECENT_CHECKINS_CACHE_TIMEOUT
+    )
+    return recent_checkins[:n]
+
+
+def count_working_days(start_date, end_date):
+    """
+    Number of weekdays (Monday to Friday) between two dates, inclusive.
+    """
+    working_days = 0
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5:  # Monday = 0, Friday = 4
+            working_days += 1
+        current_date += timedelta(days=1)
+    return working_days
+
+
+def get_week_stats(user, today):
+    """
+    Attendance statistics for the current week up to today.
+    Read from the AttendanceSummary rows maintained by apps.attendance.signals.
     """
-    user = request.user
-    today = timezone.now().date()
-    current_time = timezone.now()
-    
-    # Get user's attendance groups through the membership relationship
-    user_attendance_groups = AttendanceGroup.objects.filter(
-        attendancegroupmembership__employee=user,
-        attendancegroupmembership__is_active=True,
-        is_active=True
-    ).select_related('company', 'branch').distinct()
-    
-    # Today's status
-    today_checkins = CheckIn.objects.filter(
-        employee=user,
-        timestamp__date=today
-    ).select_related('attendance_group').order_by('timestamp')
-    
-    today_status = today_checkins.exists()
-    last_checkin = today_checkins.last() if today_checkins.exists() else None
-    
-    # Calculate today's work hours
-    today_hours = 0
-    if today_checkins.count() >= 2:
-        checkins = list(today_checkins)
-        for i in range(0, len(checkins) - 1, 2):
-            if i + 1 < len(checkins):
-                check_in = checkins[i]
-                check_out = checkins[i + 1]
-                if check_in.type == 'IN' and check_out.type == 'OUT':
-                    duration = check_out.timestamp - check_in.timestamp
-                    today_hours += duration.total_seconds() / 3600
-    
-    # Week statistics - calculate from CheckIn records if AttendanceSummary doesn't exist
     week_start = today - timedelta(days=today.weekday())
-    week_end = week_start + timedelta(days=6)
     
-    # Try to get from AttendanceSummary first
-    week_summaries = AttendanceSummary.objects.filter(
+    totals = AttendanceSummary.objects.filter(
         employee=user,
         date__gte=week_start,
         date__lte=today
+    ).aggregate(
+        # One row per group and day, so count days rather than rows
+        days_present=Count('date', distinct=True, filter=Q(is_present=True)),
+        hours_worked=Sum('total_hours')
     )
     
-    if week_summaries.exists():
-        week_stats = {
-            'days_present': week_summaries.filter(is_present=True).count(),
-            'total_days': min((today - week_start).days + 1, 5),  # Only count weekdays
-            'hours_worked': week_summaries.aggregate(total=Sum('total_hours'))['total'] or 0,
-            'percentage': 0
-        }
-    else:
-        # Calculate from CheckIn records
-        week_checkins = CheckIn.objects.filter(
-            employee=user,
-            timestamp__date__gte=week_start,
-            timestamp__date__lte=today
-        ).order_by('timestamp__date', 'timestamp')
-        
-        # Count unique days with check-ins
-        days_with_checkins = week_checkins.values('timestamp__date').distinct().count()
-        
-        # Calculate total hours worked this week
-        week_hours = 0
-        checkins_by_date = {}
-        for checkin in week_checkins:
-            date_key = checkin.timestamp.date()
-            if date_key not in checkins_by_date:
-                checkins_by_date[date_key] = []
-            checkins_by_date[date_key].append(checkin)
-        
-        for date_checkins in checkins_by_date.values():
-            for i in range(0, len(date_checkins) - 1, 2):
-                if i + 1 < len(date_checkins):
-                    check_in = date_checkins[i]
-                    check_out = date_checkins[i + 1]
-                    if check_in.type == 'IN' and check_out.type == 'OUT':
-                        duration = check_out.timestamp - check_in.timestamp
-                        week_hours += duration.total_seconds() / 3600
-        
-        # Count working days in current week up to today
-        working_days = 0
-        current_date = week_start
-        while current_date <= today:
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                working_days += 1
-            current_date += timedelta(days=1)
-        
-        week_stats = {
-            'days_present': days_with_checkins,
-            'total_days': working_days,
-            'hours_worked': round(week_hours, 1),
-            'percentage': 0
-        }
+    week_stats = {
+        'days_present': totals['days_present'],
+        'total_days': count_working_days(week_start, today),
+        'hours_worked': totals['hours_worked'] or 0,
+        'percentage': 0
+    }
     
     if week_stats['total_days'] > 0:
         week_stats['percentage'] = round((week_stats['days_present'] / week_stats['total_days']) * 100)
     
-    # Month statistics - calculate from CheckIn records if AttendanceSummary doesn't exist
+    return week_stats
+
+
+def get_month_stats(user, today):
+    """
+    Attendance statistics and average daily hours for the current month up to today.
+    Read from the AttendanceSummary rows maintained by apps.attendance.signals.
+    """
     month_start = today.replace(day=1)
-    month_summaries = AttendanceSummary.objects.filter(
+    
+    totals = AttendanceSummary.objects.filter(
         employee=user,
         date__gte=month_start,
         date__lte=today
+    ).aggregate(
+        days_present=Count('date', distinct=True, filter=Q(is_present=True)),
+        hours_worked=Sum('total_hours')
     )
     
-    # Calculate working days in month (excluding weekends)
-    working_days_in_month = 0
-    current_date = month_start
-    while current_date <= today:
-        if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-            working_days_in_month += 1
-        current_date += timedelta(days=1)
-    
-    if month_summaries.exists():
-        month_stats = {
-            'days_present': month_summaries.filter(is_present=True).count(),
-            'total_days': working_days_in_month,
-            'hours_worked': month_summaries.aggregate(total=Sum('total_hours'))['total'] or 0,
-            'percentage': 0
-        }
-        avg_daily_hours = month_summaries.filter(is_present=True).aggregate(
-            avg=Avg('total_hours')
-        )['avg'] or 0
-    else:
-        # Calculate from CheckIn records
-        month_checkins = CheckIn.objects.filter(
-            employee=user,
-            timestamp__date__gte=month_start,
-            timestamp__date__lte=today
-        ).order_by('timestamp__date', 'timestamp')
-        
-        # Count unique days with check-ins
-        days_with_checkins = month_checkins.values('timestamp__date').distinct().count()
-        
-        # Calculate total hours worked this month
-        month_hours = 0
-        daily_hours = []
-        checkins_by_date = {}
-        for checkin in month_checkins:
-            date_key = checkin.timestamp.date()
-            if date_key not in checkins_by_date:
-                checkins_by_date[date_key] = []
-            checkins_by_date[date_key].append(checkin)
-        
-        for date_checkins in checkins_by_date.values():
-            day_hours = 0
-            for i in range(0, len(date_checkins) - 1, 2):
-                if i + 1 < len(date_checkins):
-                    check_in = date_checkins[i]
-                    check_out = date_checkins[i + 1]
-                    if check_in.type == 'IN' and check_out.type == 'OUT':
-                        duration = check_out.timestamp - check_in.timestamp
-                        day_hours += duration.total_seconds() / 3600
-            if day_hours > 0:
-                daily_hours.append(day_hours)
-                month_hours += day_hours
-        
-        month_stats = {
-            'days_present': days_with_checkins,
-            'total_days': working_days_in_month,
-            'hours_worked': round(month_hours, 1),
-            'percentage': 0
-        }
-        
-        # Calculate average daily hours
-        avg_daily_hours = sum(daily_hours) / len(daily_hours) if daily_hours else 0
+    month_stats = {
+        'days_present': totals['days_present'],
+        'total_days': count_working_days(month_start, today),
+        'hours_worked': totals['hours_worked'] or 0,
+        'percentage': 0
+    }
     
     if month_stats['total_days'] > 0:
         month_stats['percentage'] = round((month_stats['days_present'] / month_stats['total_days']) * 100)
     
-    avg_daily_hours = round(avg_daily_hours, 1)
+    # Average over present days, adding up the hours of every group on a day
+    avg_daily_hours = 0
+    if month_stats['days_present']:
+        avg_daily_hours = round(month_stats['hours_worked'] / month_stats['days_present'], 1)
+    
+    return month_stats, avg_daily_hours
+
+
+def get_today_stats(today_checkins):
+    """
+    Quick statistics for today from the user's check-ins ordered by timestamp.
+    """
+    last_checkin = today_checkins[-1] if today_checkins else None
+    
+    # Calculate today's work hours
+    today_hours = 0
+    if len(today_checkins) >= 2:
+        for i in range(0, len(today_checkins) - 1, 2):
+            if i + 1 < len(today_checkins):
+                check_in = today_checkins[i]
+                check_out = today_checkins[i + 1]
+                if check_in.type == 'IN' and check_out.type == 'OUT':
+                    duration = check_out.timestamp - check_in.timestamp
+                    today_hours += duration.total_seconds() / 3600
+    
+    return {
+        'total_checkins': len(today_checkins),
+        'hours_worked': round(today_hours, 1),
+        'is_checked_in': last_checkin is not None and last_checkin.type == 'IN',
+        'first_checkin': today_checkins[0] if today_checkins else None,
+        'last_checkin': last_checkin
+    }
+
+
+def get_cached_period_stats(user, today):
+    """
+    Week and month statistics, cached per user and day.
+    apps.dashboard.signals drops the entries on new check-ins.
+    """
+    week_stats = cache.get_or_set(
+        dashboard_cache_key(user.id, today, 'week'),
+        lambda: get_week_stats(user, today),
+        DASHBOARD_CACHE_TIMEOUT
+    )
+    month_stats, avg_daily_hours = cache.get_or_set(
+        dashboard_cache_key(user.id, today, 'month'),
+        lambda: get_month_stats(user, today),
+        DASHBOARD_CACHE_TIMEOUT
+    )
+    return week_stats, month_stats, avg_daily_hours
+
+
+@login_required
+def dashboard(request):
+    """
+    Main dashboard view showing attendance statistics and recent activity.
+    """
+    user = request.user
+    today = timezone.now().date()
+    current_time = timezone.now()
+    
+    # Get user's attendance groups through the membership relationship; the
+    # subquery yields each group once, so no DISTINCT over the join is needed
+    user_attendance_groups = AttendanceGroup.objects.filter(
+        is_active=True,
+        id__in=AttendanceGroupMembership.objects.filter(
+            employee=user,
+            is_active=True
+        ).values('attendance_group_id')
+    ).select_related('company', 'branch')
+    
+    # Today's status - fetched once and reused for every today_* stat below
+    today_checkins = list(CheckIn.objects.filter(
+        employee=user,
+        timestamp__date=today
+    ).select_related('attendance_group').order_by('timestamp'))
+    
+    today_status = bool(today_checkins)
+    today_stats = get_today_stats(today_checkins)
+    last_checkin = today_stats['last_checkin']
+    
+    # Week and month statistics tolerate a little staleness, so they are cached
+    week_stats, month_stats, avg_daily_hours = get_cached_period_stats(user, today)
     
     # Recent check-ins (last 10)
-    recent_checkins = CheckIn.objects.filter(
-        employee=user
-    ).select_related('attendance_group').order_by('-timestamp')[:10]
+    recent_checkins = get_recent_checkins(user, 10)
     
     # User's periods for today
     user_periods = []
@@ -197,20 +206,6 @@ def dashboard(request):
             if hasattr(period, 'is_applicable_today') and period.is_applicable_today():
                 user_periods.append(period)
     
-    # Current status (checked in or out)
-    is_currently_checked_in = False
-    if last_checkin:
-        is_currently_checked_in = last_checkin.type == 'IN'
-    
-    # Quick stats for today
-    today_stats = {
-        'total_checkins': today_checkins.count(),
-        'hours_worked': round(today_hours, 1),
-        'is_checked_in': is_currently_checked_in,
-        'first_checkin': today_checkins.first() if today_checkins.exists() else None,
-        'last_checkin': last_checkin
-    }
-    
     context = {
         'today_status': today_status,
         'today_stats': today_stats,
@@ -227,6 +222,36 @@ def dashboard(request):
     return render(request, 'dashboard/dashboard.html', context)
 
 
+@login_required
+def dashboard_stats(request):
+    """
+    JSON endpoint with only the dashboard numbers, polled by the dashboard page
+    so refreshing the stat cards skips the full template render.
+    """
+    user = request.user
+    today = timezone.now().date()
+    
+    today_checkins = list(CheckIn.objects.filter(
+        employee=user,
+        timestamp__date=today
+    ).only('type', 'timestamp').order_by('timestamp'))
+    
+    today_stats = get_today_stats(today_checkins)
+    week_stats, month_stats, avg_daily_hours = get_cached_period_stats(user, today)
+    
+    return JsonResponse({
+        'today_status': bool(today_checkins),
+        'today_stats': {
+            'total_checkins': today_stats['total_checkins'],
+            'hours_worked': today_stats['hours_worked'],
+            'is_checked_in': today_stats['is_checked_in'],
+        },
+        'week_stats': {**week_stats, 'hours_worked': float(week_stats['hours_worked'])},
+        'month_stats': {**month_stats, 'hours_worked': float(month_stats['hours_worked'])},
+        'avg_daily_hours': float(avg_daily_hours),
+    })
+
+
 @login_required
 def profile(request):
     """
@@ -235,8 +260,10 @@ def profile(request):
     from django.contrib import messages
     from django.contrib.auth import update_session_auth_hash
     from django.contrib.auth.forms import PasswordChangeForm
+    from django.db import IntegrityError, transaction
     
     user = request.user
+    password_form = None
     
     if request.method == 'POST':
         action = request.POST.get('action')
@@ -247,16 +274,20 @@ def profile(request):
             last_name = request.POST.get('last_name', '').strip()
             email = request.POST.get('email', '').strip()
             
-            # Validate email uniqueness (excluding current user)
-            if email and CustomUser.objects.filter(email=email).exclude(id=user.id).exists():
+            # Update user fields
+            user.first_name = first_name
+            user.last_name = last_name
+            if email:
+                user.email = email
+            
+            # Email uniqueness is enforced by the unique_user_email constraint
+            try:
+                with transaction.atomic():
+                    user.save()
+            except IntegrityError:
+                user.refresh_from_db()
                 messages.error(request, 'This email address is already in use.')
             else:
-                # Update user fields
-                user.first_name = first_name
-                user.last_name = last_name
-                if email:
-                    user.email = email
-                user.save()
                 messages.success(request, 'Profile updated successfully!')
         
         elif action == 'change_password':
@@ -267,25 +298,28 @@ def profile(request):
                 update_session_auth_hash(request, user)  # Keep user logged in
                 messages.success(request, 'Password changed successfully!')
             else:
+                # Render the bound form so its errors are kept
+                password_form = form
                 for field, errors in form.errors.items():
                     for error in errors:
                         messages.error(request, f'{field.replace("_", " ").title()}: {error}')
     
+    if password_form is None:
+        password_form = PasswordChangeForm(user)
+    
     # Get user's attendance groups and recent activity
     user_attendance_groups = AttendanceGroup.objects.filter(
         employees=user,
         is_active=True
     ).select_related('company', 'branch')
     
-    recent_checkins = CheckIn.objects.filter(
-        employee=user
-    ).select_related('attendance_group').order_by('-timestamp')[:5]
+    recent_checkins = get_recent_checkins(user, 5)
     
     context = {
         'user': user,
         'attendance_groups': user_attendance_groups,
         'recent_checkins': recent_checkins,
-        'password_form': PasswordChangeForm(user),
+        'password_form': password_form,
     }
     
     return render(request, 'users/profile.html', context)
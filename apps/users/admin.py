@@ -33,9 +33,8 @@ class CustomUserAdmin(UserAdmin):
     
     readonly_fields = ('created_at', 'updated_at')
     
-    def get_queryset(self, request):
-        """Optimize queries by selecting related company"""
-        return super().get_queryset(request).select_related('company')
+    # Join the company for the changelist's company column
+    list_select_related = ('company',)
 
 
 @admin.register(UserProfile)
@@ -54,6 +53,9 @@ class UserProfileAdmin(admin.ModelAdmin):
     )
     ordering = ('-created_at',)
     
+    # Join user and company so the email/company columns don't query per row
+    list_select_related = ('user', 'user__company')
+    
     fieldsets = (
         ('User Information', {
             'fields': ('user', 'avatar', 'bio')
@@ -81,10 +83,6 @@ class UserProfileAdmin(admin.ModelAdmin):
         return obj.user.company.name if obj.user.company else 'No Company'
     get_user_company.short_description = 'Company'
     get_user_company.admin_order_field = 'user__company__name'
-    
-    def get_queryset(self, request):
-        """Optimize queries"""
-        return super().get_queryset(request).select_related('user', 'user__company')
 
 
 @admin.register(UserInvitation)
@@ -100,6 +98,8 @@ class UserInvitationAdmin(admin.ModelAdmin):
     search_fields = ('email', 'company__name', 'invited_by__username')
     ordering = ('-created_at',)
     
+    list_select_related = ('company', 'invited_by')
+    
     fieldsets = (
         ('Invitation Details', {
             'fields': ('email', 'company', 'invited_by', 'role')
@@ -119,10 +119,6 @@ class UserInvitationAdmin(admin.ModelAdmin):
     
     readonly_fields = ('invitation_token', 'accepted_at', 'created_at', 'updated_at')
     
-    def get_queryset(self, request):
-        """Optimize queries"""
-        return super().get_queryset(request).select_related('company', 'invited_by')
-    
     def has_add_permission(self, request):
         """Only allow adding invitations through the application logic"""
         return False
@@ -1,8 +1,20 @@
+from functools import cache
+
 from django.contrib.auth import views as auth_views
 from django.shortcuts import redirect
 from django.urls import reverse
 
 
+@cache
+def resolve_success_url(url_name):
+    """
+    Resolve a post-login destination on first use and reuse the string for
+    every later login. The URLconf can't be resolved at import time because
+    it imports this module.
+    """
+    return reverse(url_name)
+
+
 class CustomLoginView(auth_views.LoginView):
     """
     Custom login view that redirects users based on their role.
@@ -17,7 +29,7 @@ class CustomLoginView(auth_views.LoginView):
         
         # Redirect employees directly to check-in page
         if user.role == 'EMPLOYEE':
-            return reverse('attendance:check_in')
+            return resolve_success_url('attendance:check_in')
         
         # Redirect all other roles to dashboard
-        return reverse('dashboard:dashboard')
+        return resolve_success_url('dashboard:dashboard')
@@ -1,15 +1,34 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Max, Prefetch
 from django.utils import timezone
 from datetime import datetime, timedelta, time
 import random
 
+from apps.core.management.bulk import insert_rows
 from apps.users.models import CustomUser, UserRole, UserProfile
 from apps.companies.models import Company, Branch, Department, DepartmentMembership
 from apps.attendance.models import AttendanceGroup, AttendanceGroupMembership, Period, CheckIn, AttendanceSummary
 
 User = get_user_model()
 
+# Column order of the raw check-in and summary row tuples
+CHECKIN_COLUMNS = [
+    'id', 'employee_id', 'attendance_group_id', 'period_id', 'timestamp',
+    'latitude', 'longitude', 'type', 'status', 'notes', 'user_agent',
+    'created_at', 'updated_at'
+]
+SUMMARY_COLUMNS = [
+    'employee_id', 'attendance_group_id', 'date', 'first_checkin_id', 'last_checkout_id',
+    'total_hours', 'total_checkins', 'is_present', 'is_late', 'created_at', 'updated_at'
+]
+
+# Minute offsets applied to sample shift start and end times
+CHECKIN_OFFSETS = range(-30, 61)
+CHECKOUT_OFFSETS = range(-60, 121)
+
 
 class Command(BaseCommand):
     help = 'Create sample data for testing the SaaS Attendance Platform'
@@ -20,6 +39,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before creating sample data',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows per INSERT when bulk creating records (default: 1000)',
+        )
 
     def handle(self, *args, **options):
         # Skip clearing for now to avoid constraint issues
@@ -34,298 +59,434 @@ class Command(BaseCommand):
             self.stdout.write('Sample data already exists. Skipping creation.')
             return
 
-        # Create companies
-        companies_data = [
-            {
-                'name': 'TechCorp Solutions',
-                'description': 'Leading technology solutions provider',
-                'website': 'https://techcorp.com'
-            },
-            {
-                'name': 'Digital Innovations Ltd',
-                'description': 'Digital transformation specialists',
-                'website': 'https://digitalinnovations.com'
-            }
-        ]
-
-        companies = []
-        for company_data in companies_data:
-            # Create company owner
-            owner_username = f"owner_{company_data['name'].lower().replace(' ', '_')}"
-            owner = User.objects.create_user(
-                username=owner_username,
-                email=f"{owner_username}@{company_data['name'].lower().replace(' ', '')}.com",
-                password='owner123',
-                first_name='Company',
-                last_name='Owner',
-                role=UserRole.COMPANY_MANAGER
-            )
+        # Create everything in one transaction so the inserts commit once
+        with transaction.atomic():
+            # Create companies
+            companies_data = [
+                {
+                    'name': 'TechCorp Solutions',
+                    'description': 'Leading technology solutions provider',
+                    'website': 'https://techcorp.com'
+                },
+                {
+                    'name': 'Digital Innovations Ltd',
+                    'description': 'Digital transformation specialists',
+                    'website': 'https://digitalinnovations.com'
+                }
+            ]
 
-            # Create company
-            company = Company.objects.create(
-                name=company_data['name'],
-                description=company_data['description'],
-                website=company_data['website'],
-                owner=owner
-            )
-            owner.company = company
-            owner.save()
-
-            # Create user profile for owner
-            UserProfile.objects.create(
-                user=owner,
-                bio=f'Company Manager at {company.name}',
-                date_of_birth=datetime(1980, 1, 1).date(),
-                address='123 Main St, City, State',
-                emergency_contact_name='Emergency Contact',
-                emergency_contact_phone='+1234567890'
-            )
+            batch_size = options['batch_size']
+            # Per-row progress lines only at -v 2 and above
+            verbose = options['verbosity'] >= 2
+            role_display = dict(UserRole.choices)
+            # Every sample account of a kind shares its password, so hash each once
+            owner_password = make_password('owner123')
+            employee_password = make_password('employee123')
 
-            companies.append(company)
-            self.stdout.write(f'Created company: {company.name}')
+            # Create company owners
+            owners = []
+            for company_data in companies_data:
+                company_slug = company_data['name'].lower().replace(' ', '_')
+                company_domain = company_data['name'].lower().replace(' ', '')
+                owner_username = f"owner_{company_slug}"
+                owner = User(
+                    username=owner_username,
+                    email=f"{owner_username}@{company_domain}.com",
+                    first_name='Company',
+                    last_name='Owner',
+                    role=UserRole.COMPANY_MANAGER,
+                    password=owner_password
+                )
+                owners.append(owner)
+            User.objects.bulk_create(owners, batch_size=batch_size)
 
-        # Create branches for each company
-        for company in companies:
+            # Create companies
+            companies = [
+                Company(
+                    name=company_data['name'],
+                    description=company_data['description'],
+                    website=company_data['website'],
+                    owner=owner
+                )
+                for company_data, owner in zip(companies_data, owners)
+            ]
+            Company.objects.bulk_create(companies, batch_size=batch_size)
+
+            profiles_to_create = []
+            for company, owner in zip(companies, owners):
+                owner.company = company
+
+                # Create user profile for owner
+                profiles_to_create.append(UserProfile(
+                    user=owner,
+                    bio=f'Company Manager at {company.name}',
+                    date_of_birth=datetime(1980, 1, 1).date(),
+                    address='123 Main St, City, State',
+                    emergency_contact_name='Emergency Contact',
+                    emergency_contact_phone='+1234567890'
+                ))
+
+                if verbose:
+                    self.stdout.write(f'Created company: {company.name}')
+            User.objects.bulk_update(owners, ['company'], batch_size=batch_size)
+
+            # Create branches for each company
             branches_data = [
                 {
                     'name': 'Headquarters',
+                    'code': 'HQ',
                     'address': '123 Business Ave, Downtown',
                     'latitude': 40.7128,
                     'longitude': -74.0060
                 },
                 {
                     'name': 'Branch Office',
+                    'code': 'BO',
                     'address': '456 Corporate Blvd, Uptown',
                     'latitude': 40.7589,
                     'longitude': -73.9851
                 }
             ]
 
-            for branch_data in branches_data:
-                branch = Branch.objects.create(
+            branches = [
+                Branch(
                     name=branch_data['name'],
+                    code=branch_data['code'],
                     company=company,
                     address=branch_data['address'],
                     latitude=branch_data['latitude'],
                     longitude=branch_data['longitude']
                 )
+                for company in companies
+                for branch_data in branches_data
+            ]
+            Branch.objects.bulk_create(branches, batch_size=batch_size)
 
-                # Create departments for each branch
-                departments_data = [
-                    'Engineering',
-                    'Human Resources',
-                    'Sales',
-                    'Marketing'
-                ]
+            # Create departments and their attendance groups for each branch
+            departments_data = [
+                ('Engineering', 'ENG'),
+                ('Human Resources', 'HR'),
+                ('Sales', 'SAL'),
+                ('Marketing', 'MKT')
+            ]
 
-                for dept_name in departments_data:
-                    department = Department.objects.create(
+            departments = []
+            attendance_groups = []
+            for branch in branches:
+                for dept_name, dept_code in departments_data:
+                    departments.append(Department(
                         name=dept_name,
+                        code=dept_code,
                         branch=branch
-                    )
+                    ))
 
-                    # Create attendance group for each department
-                    attendance_group = AttendanceGroup.objects.create(
+                    attendance_groups.append(AttendanceGroup(
                         name=f'{dept_name} - {branch.name}',
-                        company=company,
+                        company=branch.company,
                         branch=branch,
                         latitude=branch.latitude,
                         longitude=branch.longitude,
                         radius=100,  # 100 meters
                         description=f'Attendance group for {dept_name} department'
+                    ))
+            Department.objects.bulk_create(departments, batch_size=batch_size)
+            AttendanceGroup.objects.bulk_create(attendance_groups, batch_size=batch_size)
+
+            # Create periods (shifts) for each attendance group
+            periods_data = [
+                {
+                    'name': 'Morning Shift',
+                    'start_time': time(9, 0),
+                    'end_time': time(17, 0),
+                    'weekdays': '1,2,3,4,5'  # Monday to Friday
+                },
+                {
+                    'name': 'Flexible Hours',
+                    'start_time': time(8, 0),
+                    'end_time': time(18, 0),
+                    'weekdays': '1,2,3,4,5'  # Monday to Friday
+                }
+            ]
+
+            periods = [
+                Period(
+                    name=period_data['name'],
+                    group=attendance_group,
+                    start_time=period_data['start_time'],
+                    end_time=period_data['end_time'],
+                    weekdays=period_data['weekdays'],
+                    late_checkin_grace_minutes=15,
+                    early_checkout_grace_minutes=15
+                )
+                for attendance_group in attendance_groups
+                for period_data in periods_data
+            ]
+            Period.objects.bulk_create(periods, batch_size=batch_size)
+
+            # Create users for each department
+            roles = [UserRole.HR_EMPLOYEE, UserRole.EMPLOYEE, UserRole.EMPLOYEE]
+            users_to_create = []
+            user_placements = []
+            for department, attendance_group in zip(departments, attendance_groups):
+                branch = department.branch
+                company = branch.company
+                
+                # Name fragments are the same for every role, so build them once per department
+                dept_slug = department.name.lower()
+                branch_slug = branch.name.lower().replace(' ', '_')
+                company_slug = company.name.lower().replace(' ', '_')
+                company_domain = company.name.lower().replace(' ', '')
+                
+                for i, role in enumerate(roles):
+                    username = f"{dept_slug}_{branch_slug}_{i+1}_{company_slug}"
+                    user = User(
+                        username=username,
+                        email=f"{username}@{company_domain}.com",
+                        first_name=f'{department.name}',
+                        last_name=f'Employee {i+1}',
+                        role=role,
+                        company=company,
+                        password=employee_password
                     )
+                    users_to_create.append(user)
+                    user_placements.append((user, i, department, attendance_group))
+            User.objects.bulk_create(users_to_create, batch_size=batch_size)
 
-                    # Create periods (shifts) for attendance group
-                    periods_data = [
-                        {
-                            'name': 'Morning Shift',
-                            'start_time': time(9, 0),
-                            'end_time': time(17, 0),
-                            'weekdays': '1,2,3,4,5'  # Monday to Friday
-                        },
-                        {
-                            'name': 'Flexible Hours',
-                            'start_time': time(8, 0),
-                            'end_time': time(18, 0),
-                            'weekdays': '1,2,3,4,5'  # Monday to Friday
-                        }
-                    ]
-
-                    for period_data in periods_data:
-                        Period.objects.create(
-                            name=period_data['name'],
-                            group=attendance_group,
-                            start_time=period_data['start_time'],
-                            end_time=period_data['end_time'],
-                            weekdays=period_data['weekdays'],
-                            grace_period_minutes=15,
-                            late_threshold_minutes=30
-                        )
-
-                    # Create users for each department
-                    roles = [UserRole.HR_EMPLOYEE, UserRole.EMPLOYEE, UserRole.EMPLOYEE]
-                    for i, role in enumerate(roles):
-                        username = f"{dept_name.lower()}_{branch.name.lower().replace(' ', '_')}_{i+1}_{company.name.lower().replace(' ', '_')}"
-                        user = User.objects.create_user(
-                            username=username,
-                            email=f"{username}@{company.name.lower().replace(' ', '')}.com",
-                            password='employee123',
-                            first_name=f'{dept_name}',
-                            last_name=f'Employee {i+1}',
-                            role=role,
-                            company=company
-                        )
-
-                        # Create user profile
-                        UserProfile.objects.create(
-                            user=user,
-                            bio=f'{role.replace("_", " ").title()} in {dept_name} department',
-                            date_of_birth=datetime(1985 + i, 1, 1).date(),
-                            address=f'{100 + i} Employee St, City, State',
-                            emergency_contact_name=f'Emergency Contact {i+1}',
-                            emergency_contact_phone=f'+123456789{i}'
-                        )
-
-                        # Add user to department
-                        DepartmentMembership.objects.create(
-                            user=user,
-                            department=department,
-                            role='member'
-                        )
-
-                        # Add user to attendance group
-                        AttendanceGroupMembership.objects.create(
-                            user=user,
-                            group=attendance_group,
-                            is_active=True
-                        )
-
-                        self.stdout.write(f'Created user: {user.username} ({user.get_role_display()})')
-
-        # Create sample attendance data for the last 30 days
-        self.stdout.write('Creating sample attendance data...')
-        
-        users = User.objects.filter(role__in=[UserRole.HR_EMPLOYEE, UserRole.EMPLOYEE])
-        today = timezone.now().date()
+            dept_memberships = []
+            group_memberships = []
+            for user, i, department, attendance_group in user_placements:
+                # Create user profile
+                profiles_to_create.append(UserProfile(
+                    user=user,
+                    bio=f'{user.role.replace("_", " ").title()} in {department.name} department',
+                    date_of_birth=datetime(1985 + i, 1, 1).date(),
+                    address=f'{100 + i} Employee St, City, State',
+                    emergency_contact_name=f'Emergency Contact {i+1}',
+                    emergency_contact_phone=f'+123456789{i}'
+                ))
+
+                # Add user to department
+                dept_memberships.append(DepartmentMembership(
+                    employee=user,
+                    department=department,
+                    position='member'
+                ))
+
+                # Add user to attendance group
+                group_memberships.append(AttendanceGroupMembership(
+                    employee=user,
+                    attendance_group=attendance_group,
+                    is_active=True
+                ))
+
+                if verbose:
+                    self.stdout.write(f'Created user: {user.username} ({role_display[user.role]})')
+
+            UserProfile.objects.bulk_create(profiles_to_create, batch_size=batch_size)
+            DepartmentMembership.objects.bulk_create(dept_memberships, batch_size=batch_size)
+            AttendanceGroupMembership.objects.bulk_create(group_memberships, batch_size=batch_size)
+
+            # Create sample attendance data for the last 30 days
+            self.stdout.write('Creating sample attendance data...')
         
-        for user in users:
-            attendance_groups = AttendanceGroup.objects.filter(
-                attendancegroupmembership__user=user,
-                attendancegroupmembership__is_active=True
+            # Load each user's active group and its active periods up front instead of
+            # querying them per user; users are streamed in chunks and the rows below
+            # only keep their ids, so each chunk can be freed once processed
+            users = User.objects.filter(
+                role__in=[UserRole.HR_EMPLOYEE, UserRole.EMPLOYEE]
+            ).prefetch_related(
+                Prefetch(
+                    'attendancegroupmembership_set',
+                    queryset=AttendanceGroupMembership.objects.filter(
+                        is_active=True
+                    ).select_related('attendance_group').prefetch_related(
+                        Prefetch('attendance_group__periods', queryset=Period.objects.filter(is_active=True))
+                    ),
+                    to_attr='active_group_memberships'
+                )
             )
+            today = timezone.now().date()
+            # The working days are the same for every user, so work them out once
+            working_dates = [
+                date for date in (today - timedelta(days=days_ago) for days_ago in range(20))
+                if date.weekday() < 5  # Skip weekends
+            ]
+            checkin_rows = []
+            summary_rows = []
             
-            if not attendance_groups.exists():
-                continue
-                
-            attendance_group = attendance_groups.first()
-            periods = attendance_group.periods.filter(is_active=True)
-            
-            if not periods.exists():
-                continue
+            # Check-ins are written with raw INSERTs, which can't hand back primary
+            # keys, so their ids are allocated here for the summaries to reference.
+            # Lock out concurrent check-in inserts first so none can take an id in
+            # the allocated range before the sequence is moved past it.
+            self.lock_table(CheckIn)
+            next_checkin_id = (CheckIn.objects.aggregate(max_id=Max('id'))['max_id'] or 0) + 1
+            adapt_datetime = connection.ops.adapt_datetimefield_value
+            adapt_date = connection.ops.adapt_datefield_value
+            # Raw rows skip auto_now/auto_now_add, so every row is stamped with one timestamp
+            now = adapt_datetime(timezone.now())
+            # Bind the zone once; replace(tzinfo=...) is safe with zoneinfo zones
+            tz = timezone.get_current_timezone()
+            # Bound RNG methods for the per-row draws below
+            rand = random.random
+            uniform = random.uniform
+            choice = random.choice
+        
+            for user in users.iterator(chunk_size=500):
+                if not user.active_group_memberships:
+                    continue
                 
-            period = periods.first()
-            
-            # Create attendance for last 20 working days
-            for days_ago in range(20):
-                date = today - timedelta(days=days_ago)
+                attendance_group = user.active_group_memberships[0].attendance_group
+                periods = attendance_group.periods.all()
                 
-                # Skip weekends
-                if date.weekday() >= 5:
+                if not periods:
                     continue
                 
-                # 90% chance of attendance
-                if random.random() < 0.9:
-                    # Random check-in time (with some variation)
-                    base_checkin = datetime.combine(date, period.start_time)
-                    checkin_variation = random.randint(-30, 60)  # -30 to +60 minutes
-                    checkin_time = base_checkin + timedelta(minutes=checkin_variation)
+                period = periods[0]
+                group_latitude = float(attendance_group.latitude)
+                group_longitude = float(attendance_group.longitude)
+            
+                # Create attendance for last 20 days, weekends excluded
+                for date in working_dates:
+                    # 90% chance of attendance
+                    if rand() < 0.9:
+                        # Random check-in time (with some variation)
+                        base_checkin = datetime.combine(date, period.start_time)
+                        checkin_variation = choice(CHECKIN_OFFSETS)  # -30 to +60 minutes
+                        checkin_time = base_checkin + timedelta(minutes=checkin_variation)
+                        is_late = checkin_time.time() > period.start_time
                     
-                    # Create check-in
-                    checkin = CheckIn.objects.create(
-                        employee=user,
-                        attendance_group=attendance_group,
-                        period=period,
-                        timestamp=timezone.make_aware(checkin_time),
-                        latitude=attendance_group.latitude + random.uniform(-0.001, 0.001),
-                        longitude=attendance_group.longitude + random.uniform(-0.001, 0.001),
-                        type=CheckIn.CheckInType.CHECK_IN,
-                        status=CheckIn.CheckInStatus.APPROVED,
-                        notes=f'Check-in for {date}'
-                    )
+                        # Create check-in
+                        checkin_id = next_checkin_id
+                        next_checkin_id += 1
+                        checkin_rows.append((
+                            checkin_id,
+                            user.id,
+                            attendance_group.id,
+                            period.id,
+                            adapt_datetime(checkin_time.replace(tzinfo=tz)),
+                            round(group_latitude + uniform(-0.001, 0.001), 6),
+                            round(group_longitude + uniform(-0.001, 0.001), 6),
+                            CheckIn.CheckInType.CHECK_IN,
+                            CheckIn.CheckInStatus.LATE if is_late else CheckIn.CheckInStatus.ON_TIME,
+                            f'Check-in for {date}',
+                            '',
+                            now,
+                            now
+                        ))
                     
-                    # 95% chance of check-out
-                    if random.random() < 0.95:
-                        # Random check-out time
-                        base_checkout = datetime.combine(date, period.end_time)
-                        checkout_variation = random.randint(-60, 120)  # -60 to +120 minutes
-                        checkout_time = base_checkout + timedelta(minutes=checkout_variation)
+                        # 95% chance of check-out
+                        if rand() < 0.95:
+                            # Random check-out time
+                            base_checkout = datetime.combine(date, period.end_time)
+                            checkout_variation = choice(CHECKOUT_OFFSETS)  # -60 to +120 minutes
+                            checkout_time = base_checkout + timedelta(minutes=checkout_variation)
                         
-                        # Create check-out
-                        checkout = CheckIn.objects.create(
-                            employee=user,
-                            attendance_group=attendance_group,
-                            period=period,
-                            timestamp=timezone.make_aware(checkout_time),
-                            latitude=attendance_group.latitude + random.uniform(-0.001, 0.001),
-                            longitude=attendance_group.longitude + random.uniform(-0.001, 0.001),
-                            type=CheckIn.CheckInType.CHECK_OUT,
-                            status=CheckIn.CheckInStatus.APPROVED,
-                            notes=f'Check-out for {date}'
-                        )
+                            # Create check-out
+                            checkout_id = next_checkin_id
+                            next_checkin_id += 1
+                            checkin_rows.append((
+                                checkout_id,
+                                user.id,
+                                attendance_group.id,
+                                period.id,
+                                adapt_datetime(checkout_time.replace(tzinfo=tz)),
+                                round(group_latitude + uniform(-0.001, 0.001), 6),
+                                round(group_longitude + uniform(-0.001, 0.001), 6),
+                                CheckIn.CheckInType.CHECK_OUT,
+                                (
+                                    CheckIn.CheckInStatus.EARLY if checkout_time.time() < period.end_time
+                                    else CheckIn.CheckInStatus.ON_TIME
+                                ),
+                                f'Check-out for {date}',
+                                '',
+                                now,
+                                now
+                            ))
                         
-                        # Calculate hours worked
-                        hours_worked = (checkout.timestamp - checkin.timestamp).total_seconds() / 3600
+                            # Calculate hours worked
+                            hours_worked = (checkout_time - checkin_time).total_seconds() / 3600
                         
-                        # Create attendance summary
-                        AttendanceSummary.objects.create(
-                            employee=user,
-                            attendance_group=attendance_group,
-                            date=date,
-                            first_checkin=checkin,
-                            last_checkout=checkout,
-                            total_hours=hours_worked,
-                            is_present=True,
-                            is_late=checkin_time.time() > period.start_time,
-                            is_early_departure=checkout_time.time() < period.end_time
-                        )
+                            # Create attendance summary
+                            summary_rows.append((
+                                user.id,
+                                attendance_group.id,
+                                adapt_date(date),
+                                checkin_id,
+                                checkout_id,
+                                round(hours_worked, 2),
+                                1,
+                                True,
+                                is_late,
+                                now,
+                                now
+                            ))
+                        else:
+                            # No check-out, create summary with just check-in
+                            summary_rows.append((
+                                user.id,
+                                attendance_group.id,
+                                adapt_date(date),
+                                checkin_id,
+                                None,
+                                0,
+                                1,
+                                True,
+                                is_late,
+                                now,
+                                now
+                            ))
                     else:
-                        # No check-out, create summary with just check-in
-                        AttendanceSummary.objects.create(
-                            employee=user,
-                            attendance_group=attendance_group,
-                            date=date,
-                            first_checkin=checkin,
-                            total_hours=0,
-                            is_present=True,
-                            is_late=checkin_time.time() > period.start_time,
-                            is_early_departure=False
-                        )
-                else:
-                    # Absent day
-                    AttendanceSummary.objects.create(
-                        employee=user,
-                        attendance_group=attendance_group,
-                        date=date,
-                        total_hours=0,
-                        is_present=False,
-                        is_late=False,
-                        is_early_departure=False
-                    )
+                        # Absent day
+                        summary_rows.append((
+                            user.id,
+                            attendance_group.id,
+                            adapt_date(date),
+                            None,
+                            None,
+                            0,
+                            0,
+                            False,
+                            False,
+                            now,
+                            now
+                        ))
+                
+                # Flush full batches so only one batch of row tuples is held at a time
+                if len(checkin_rows) >= batch_size:
+                    self.flush_attendance_rows(checkin_rows, summary_rows, batch_size)
+
+            self.flush_attendance_rows(checkin_rows, summary_rows, batch_size)
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created sample data!')
         )
         
         # Print summary
+        # All table counts in one round trip
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM companies_company),
+                    (SELECT COUNT(*) FROM companies_branch),
+                    (SELECT COUNT(*) FROM companies_department),
+                    (SELECT COUNT(*) FROM users_customuser),
+                    (SELECT COUNT(*) FROM attendance_attendancegroup),
+                    (SELECT COUNT(*) FROM attendance_period),
+                    (SELECT COUNT(*) FROM attendance_checkin),
+                    (SELECT COUNT(*) FROM attendance_attendancesummary)
+            """)
+            (companies_count, branches_count, departments_count, users_count,
+             groups_count, periods_count, checkins_count, summaries_count) = cursor.fetchone()
+        
         self.stdout.write('\n=== SAMPLE DATA SUMMARY ===')
-        self.stdout.write(f'Companies: {Company.objects.count()}')
-        self.stdout.write(f'Branches: {Branch.objects.count()}')
-        self.stdout.write(f'Departments: {Department.objects.count()}')
-        self.stdout.write(f'Users: {User.objects.count()}')
-        self.stdout.write(f'Attendance Groups: {AttendanceGroup.objects.count()}')
-        self.stdout.write(f'Periods: {Period.objects.count()}')
-        self.stdout.write(f'Check-ins: {CheckIn.objects.count()}')
-        self.stdout.write(f'Attendance Summaries: {AttendanceSummary.objects.count()}')
+        self.stdout.write(f'Companies: {companies_count}')
+        self.stdout.write(f'Branches: {branches_count}')
+        self.stdout.write(f'Departments: {departments_count}')
+        self.stdout.write(f'Users: {users_count}')
+        self.stdout.write(f'Attendance Groups: {groups_count}')
+        self.stdout.write(f'Periods: {periods_count}')
+        self.stdout.write(f'Check-ins: {checkins_count}')
+        self.stdout.write(f'Attendance Summaries: {summaries_count}')
         
         self.stdout.write('\n=== TEST ACCOUNTS ===')
         self.stdout.write('Superuser: admin / admin (password you set)')
@@ -334,3 +495,23 @@ class Command(BaseCommand):
         self.stdout.write('Employees: engineering_headquarters_1_techcorp_solutions / employee123')
         self.stdout.write('           hr_headquarters_1_techcorp_solutions / employee123')
         self.stdout.write('           (and many more...)')
+
+    def lock_table(self, model):
+        """Block other writers to the model's table until the current transaction ends"""
+        if connection.vendor == 'postgresql':
+            # SHARE ROW EXCLUSIVE lets readers through but queues every other
+            # writer, including inserts that would draw ids from the sequence
+            with connection.cursor() as cursor:
+                cursor.execute('LOCK TABLE {} IN SHARE ROW EXCLUSIVE MODE'.format(
+                    connection.ops.quote_name(model._meta.db_table)
+                ))
+        # SQLite needs nothing extra: the surrounding transaction has already
+        # written, so it holds the database write lock until it commits
+
+    def flush_attendance_rows(self, checkin_rows, summary_rows, batch_size):
+        """Insert the accumulated check-in and summary rows and empty both buffers"""
+        # Check-ins first so the summaries' first_checkin/last_checkout rows exist
+        insert_rows(CheckIn, CHECKIN_COLUMNS, checkin_rows, batch_size)
+        insert_rows(AttendanceSummary, SUMMARY_COLUMNS, summary_rows, batch_size)
+        checkin_rows.clear()
+        summary_rows.clear()
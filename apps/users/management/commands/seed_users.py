@@ -1,11 +1,13 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.db import transaction
 from faker import Faker
 import random
 
 User = get_user_model()
 fake = Faker()
+GENERATED_NAME_COUNT = 26  # 2 owners + 8 HR managers + 16 employees
 
 class Command(BaseCommand):
     help = 'Seed users: 1 Super Admin, 2 Company Owners, 8 HR Managers, 16 Employees'
@@ -16,8 +18,20 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing users before seeding',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows per INSERT when bulk creating records (default: 5000)',
+        )
 
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.password_hashes = {}
+        # Draw every generated name up front instead of dispatching to Faker per user
+        self.first_names = [fake.first_name() for _ in range(GENERATED_NAME_COUNT)]
+        self.last_names = [fake.last_name() for _ in range(GENERATED_NAME_COUNT)]
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing users...'))
             User.objects.all().delete()
@@ -47,18 +61,26 @@ class Command(BaseCommand):
             )
         )
 
+    def build_user(self, password, **fields):
+        """Build an unsaved user with a hashed password, ready for bulk_create"""
+        # Hash each distinct seed password once; users sharing it share the hash
+        if password not in self.password_hashes:
+            self.password_hashes[password] = make_password(password)
+        return User(password=self.password_hashes[password], **fields)
+
     def create_super_admin(self):
         """Create the Super Admin user"""
-        super_admin = User.objects.create_user(
+        super_admin = self.build_user(
+            'admin123',
             username='superadmin',
             email='superadmin@attendancehub.com',
-            password='admin123',
             first_name='Super',
             last_name='Admin',
             role='SUPER_ADMIN',
             is_staff=True,
             is_superuser=True
         )
+        User.objects.bulk_create([super_admin], batch_size=self.batch_size)
         self.stdout.write(f'Created Super Admin: {super_admin.username}')
         return super_admin
 
@@ -68,15 +90,18 @@ class Command(BaseCommand):
         company_names = ['TechCorp Solutions', 'InnovateLab Inc']
         
         for i, company_name in enumerate(company_names, 1):
-            owner = User.objects.create_user(
+            owner = self.build_user(
+                'owner123',
                 username=f'owner{i}',
                 email=f'owner{i}@{company_name.lower().replace(" ", "").replace("solutions", "").replace("inc", "")}.com',
-                password='owner123',
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=self.first_names.pop(),
+                last_name=self.last_names.pop(),
                 role='COMPANY_MANAGER'
             )
             owners.append(owner)
+
+        User.objects.bulk_create(owners, batch_size=self.batch_size)
+        for i, owner in enumerate(owners, 1):
             self.stdout.write(f'Created Company Owner {i}: {owner.username} ({owner.get_full_name()})')
         
         return owners
@@ -87,29 +112,29 @@ class Command(BaseCommand):
         
         # Company 1: 4 HR Managers
         for i in range(1, 5):
-            hr_manager = User.objects.create_user(
+            hr_managers.append(self.build_user(
+                'hr123',
                 username=f'hr1_{i}',
                 email=f'hr{i}@techcorp.com',
-                password='hr123',
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=self.first_names.pop(),
+                last_name=self.last_names.pop(),
                 role='HR_EMPLOYEE'
-            )
-            hr_managers.append(hr_manager)
-            self.stdout.write(f'Created HR Manager (Company 1): {hr_manager.username} ({hr_manager.get_full_name()})')
+            ))
         
         # Company 2: 4 HR Managers
         for i in range(1, 5):
-            hr_manager = User.objects.create_user(
+            hr_managers.append(self.build_user(
+                'hr123',
                 username=f'hr2_{i}',
                 email=f'hr{i}@innovatelab.com',
-                password='hr123',
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=self.first_names.pop(),
+                last_name=self.last_names.pop(),
                 role='HR_EMPLOYEE'
-            )
-            hr_managers.append(hr_manager)
-            self.stdout.write(f'Created HR Manager (Company 2): {hr_manager.username} ({hr_manager.get_full_name()})')
+            ))
+
+        User.objects.bulk_create(hr_managers, batch_size=self.batch_size)
+        for idx, hr_manager in enumerate(hr_managers):
+            self.stdout.write(f'Created HR Manager (Company {idx // 4 + 1}): {hr_manager.username} ({hr_manager.get_full_name()})')
         
         return hr_managers
 
@@ -119,29 +144,29 @@ class Command(BaseCommand):
         
         # Company 1: 8 Employees
         for i in range(1, 9):
-            employee = User.objects.create_user(
+            employees.append(self.build_user(
+                'emp123',
                 username=f'emp1_{i}',
                 email=f'employee{i}@techcorp.com',
-                password='emp123',
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=self.first_names.pop(),
+                last_name=self.last_names.pop(),
                 role='EMPLOYEE'
-            )
-            employees.append(employee)
-            self.stdout.write(f'Created Employee (Company 1): {employee.username} ({employee.get_full_name()})')
+            ))
         
         # Company 2: 8 Employees
         for i in range(1, 9):
-            employee = User.objects.create_user(
+            employees.append(self.build_user(
+                'emp123',
                 username=f'emp2_{i}',
                 email=f'employee{i}@innovatelab.com',
-                password='emp123',
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=self.first_names.pop(),
+                last_name=self.last_names.pop(),
                 role='EMPLOYEE'
-            )
-            employees.append(employee)
-            self.stdout.write(f'Created Employee (Company 2): {employee.username} ({employee.get_full_name()})')
+            ))
+
+        User.objects.bulk_create(employees, batch_size=self.batch_size)
+        for idx, employee in enumerate(employees):
+            self.stdout.write(f'Created Employee (Company {idx // 8 + 1}): {employee.username} ({employee.get_full_name()})')
         
         return employees
 
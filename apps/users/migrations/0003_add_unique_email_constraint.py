@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:24
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Refuse to add the constraint while users still share an email address,
+    naming the clashes so they can be fixed before migrating again.
+    """
+    CustomUser = apps.get_model('users', 'CustomUser')
+    duplicates = (
+        CustomUser.objects.exclude(email='')
+        .values('email')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+        .order_by('email')
+    )
+    if not duplicates:
+        return
+
+    lines = []
+    for row in duplicates:
+        usernames = CustomUser.objects.filter(email=row['email']).order_by('username').values_list('username', flat=True)
+        lines.append(f"  {row['email']}: {', '.join(usernames)}")
+    raise RuntimeError(
+        'Cannot add the unique email constraint: these email addresses are '
+        'shared by more than one user. Change or blank the duplicates, then '
+        'run migrate again.\n' + '\n'.join(lines)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('companies', '0003_add_radius_fields'),
+        ('users', '0002_add_managed_branch_field'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(condition=models.Q(('email', ''), _negated=True), fields=('email',), name='unique_user_email'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('companies', '0003_add_radius_fields'),
+        ('users', '0003_add_unique_email_constraint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='role',
+            field=models.CharField(choices=[('SUPER_ADMIN', 'Super Admin'), ('COMPANY_MANAGER', 'Company Manager'), ('HR_EMPLOYEE', 'HR Employee'), ('EMPLOYEE', 'Employee')], db_index=True, default='EMPLOYEE', help_text="User's role within the system", max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['company', 'role'], name='users_custo_company_a935fc_idx'),
+        ),
+    ]
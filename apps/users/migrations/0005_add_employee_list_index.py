@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('companies', '0003_add_radius_fields'),
+        ('users', '0004_add_role_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['company', 'is_active', 'first_name', 'last_name', 'id'], name='users_custo_company_dbcb4c_idx'),
+        ),
+    ]
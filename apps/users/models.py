@@ -10,6 +10,11 @@ class UserRole(models.TextChoices):
     EMPLOYEE = 'EMPLOYEE', 'Employee'
 
 
+# Roles allowed to manage company-level and HR operations
+COMPANY_MANAGEMENT_ROLES = frozenset({UserRole.SUPER_ADMIN, UserRole.COMPANY_MANAGER})
+HR_MANAGEMENT_ROLES = COMPANY_MANAGEMENT_ROLES | {UserRole.HR_EMPLOYEE}
+
+
 class CustomUser(AbstractUser):
     """
     Custom user model extending AbstractUser with role-based access control.
@@ -19,6 +24,7 @@ class CustomUser(AbstractUser):
         max_length=20, 
         choices=UserRole.choices, 
         default=UserRole.EMPLOYEE,
+        db_index=True,
         help_text="User's role within the system"
     )
     # Link a user directly to a company for easier querying
@@ -62,8 +68,20 @@ class CustomUser(AbstractUser):
                 fields=['company', 'employee_id'],
                 name='unique_employee_id_per_company',
                 condition=models.Q(employee_id__isnull=False) & ~models.Q(employee_id='')
+            ),
+            # Ensure email addresses are unique across users (blank emails allowed)
+            models.UniqueConstraint(
+                fields=['email'],
+                name='unique_user_email',
+                condition=~models.Q(email='')
             )
         ]
+        indexes = [
+            models.Index(fields=['company', 'role']),
+            # Backs the employee list's company/status filter and its keyset
+            # ordering on (first_name, last_name, id)
+            models.Index(fields=['company', 'is_active', 'first_name', 'last_name', 'id']),
+        ]
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
@@ -83,12 +101,12 @@ class CustomUser(AbstractUser):
     @property
     def can_manage_company(self):
         """Check if user can manage company-level operations"""
-        return self.role in [UserRole.SUPER_ADMIN, UserRole.COMPANY_MANAGER]
+        return self.role in COMPANY_MANAGEMENT_ROLES
     
     @property
     def can_manage_hr(self):
         """Check if user can manage HR operations"""
-        return self.role in [UserRole.SUPER_ADMIN, UserRole.COMPANY_MANAGER, UserRole.HR_EMPLOYEE]
+        return self.role in HR_MANAGEMENT_ROLES
     
     def get_accessible_employees(self):
         """Get employees this user can access based on their role and branch assignment"""
@@ -161,6 +179,16 @@ class UserProfile(models.Model):
         return f"{self.user.username}'s Profile"
 
 
+class UserInvitationQuerySet(models.QuerySet):
+    """
+    Query helpers for invitations, evaluated in the database.
+    """
+    def expired(self):
+        """Invitations whose expiry time has passed"""
+        from django.utils import timezone
+        return self.filter(expires_at__lt=timezone.now())
+
+
 class UserInvitation(models.Model):
     """
     Model to handle user invitations to join companies.
@@ -210,6 +238,8 @@ class UserInvitation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserInvitationQuerySet.as_manager()
+    
     class Meta:
         db_table = 'users_userinvitation'
         verbose_name = 'User Invitation'
@@ -228,6 +258,11 @@ class UserInvitation(models.Model):
     
     @property
     def is_expired(self):
+        """
+        Whether this invitation has expired.
+        For filtering many invitations use UserInvitation.objects.expired(),
+        which compares in SQL instead of per object.
+        """
         from django.utils import timezone
         return timezone.now() > self.expires_at
     
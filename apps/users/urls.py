@@ -11,6 +11,7 @@ urlpatterns = [
     # Employee management
     path('employees/', views.employee_list, name='employee_list'),
     path('employees/create/', views.employee_create, name='employee_create'),
+    path('employees/export/', views.employee_export, name='employee_export'),
     path('employees/<int:employee_id>/', views.employee_detail, name='employee_detail'),
     path('employees/<int:employee_id>/edit/', views.employee_edit, name='employee_edit'),
     path('employees/<int:employee_id>/delete/', views.employee_delete, name='employee_delete'),
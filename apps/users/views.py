@@ -1,21 +1,31 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.http import JsonResponse
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.http import JsonResponse, StreamingHttpResponse
+from django.db.models import Q, Count, Exists, OuterRef, Prefetch, prefetch_related_objects
 from django.views.decorators.http import require_POST
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.utils import timezone
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from datetime import datetime, timedelta
+import csv
 import json
 
 from .models import CustomUser, UserRole, UserProfile, UserInvitation
 from apps.companies.models import Company, Branch, Department, DepartmentMembership
-from apps.attendance.models import AttendanceGroup, AttendanceGroupMembership
+from apps.attendance.models import AttendanceGroup, AttendanceGroupMembership, AttendanceSummary
 
 User = get_user_model()
 
+EMPLOYEES_PER_PAGE = 20
+# UserRole.choices rebuilds its list on every access; the roles never change
+ROLE_CHOICES = tuple(UserRole.choices)
+EMPLOYEE_EXPORT_FIELDS = ('id', 'first_name', 'last_name', 'email', 'role', 'is_active')
+EMPLOYEE_EXPORT_CHUNK_SIZE = 500
+# Leading characters spreadsheet apps treat as the start of a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
 # Permission decorators
 def hr_required(user):
     """Check if user has HR permissions"""
@@ -23,7 +33,59 @@ def hr_required(user):
 
 def company_manager_required(user):
     """Check if user is a company manager"""
-    return user.is_authenticated and user.role in [UserRole.COMPANY_MANAGER, UserRole.SUPER_ADMIN]
+    return user.is_authenticated and user.can_manage_company
+
+def encode_employee_cursor(employee):
+    """
+    Encode an employee's position in the employee list ordering as an opaque
+    cursor for the next page link.
+    """
+    key = [employee.first_name, employee.last_name, employee.id]
+    return urlsafe_base64_encode(json.dumps(key).encode())
+
+def decode_employee_cursor(cursor):
+    """
+    Turn a cursor from encode_employee_cursor into a filter matching the
+    employees ordered after it, or None if the cursor is malformed.
+    """
+    try:
+        first_name, last_name, employee_id = json.loads(urlsafe_base64_decode(cursor))
+        if not isinstance(first_name, str) or not isinstance(last_name, str):
+            return None
+        employee_id = int(employee_id)
+    except (ValueError, TypeError):
+        return None
+    return (
+        Q(first_name__gt=first_name) |
+        Q(first_name=first_name, last_name__gt=last_name) |
+        Q(first_name=first_name, last_name=last_name, id__gt=employee_id)
+    )
+
+def employee_rows(queryset):
+    """
+    Stream employees as plain dicts of EMPLOYEE_EXPORT_FIELDS, reading them in
+    chunks so memory stays bounded however many employees are exported.
+    """
+    yield from queryset.values(*EMPLOYEE_EXPORT_FIELDS).iterator(
+        chunk_size=EMPLOYEE_EXPORT_CHUNK_SIZE
+    )
+
+def csv_safe(value):
+    """
+    Escape user-supplied text for CSV export so spreadsheet apps don't evaluate
+    it as a formula.
+    """
+    if value and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+class Echo:
+    """
+    File-like object that hands back whatever is written to it, so csv.writer
+    can produce rows for a StreamingHttpResponse.
+    """
+    def write(self, value):
+        return value
 
 @login_required
 def profile(request):
@@ -58,9 +120,18 @@ def employee_list(request):
     role_filter = request.GET.get('role', '')
     status_filter = request.GET.get('status', 'active')
     
-    # Base queryset - employees accessible to this user based on role and branch
-    employees = user.get_accessible_employees().select_related('company').prefetch_related(
-        'departmentmembership_set__department__branch'
+    # Base queryset - employees accessible to this user based on role and branch.
+    # Only active memberships are shown, so only those are prefetched; the prefetch
+    # runs for just the rows of the current page once the keyset slice is fetched.
+    employees = user.get_accessible_employees().only(
+        # Just the columns the list template and the pagination cursor read
+        'id', 'first_name', 'last_name', 'email', 'role', 'is_active'
+    ).prefetch_related(
+        Prefetch(
+            'departmentmembership_set',
+            queryset=DepartmentMembership.objects.filter(is_active=True).select_related('department'),
+            to_attr='active_memberships'
+        )
     )
     
     # Apply search filter
@@ -88,35 +159,75 @@ def employee_list(request):
     elif status_filter == 'inactive':
         employees = employees.filter(is_active=False)
     
-    # Order by name
-    employees = employees.order_by('first_name', 'last_name')
+    # Order by name, with id as a tie-breaker so the cursor is unambiguous
+    employees = employees.order_by('first_name', 'last_name', 'id')
+    total_employees = employees.count()
     
-    # Pagination
-    paginator = Paginator(employees, 20)  # 20 employees per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset pagination: seek past the last employee of the previous page
+    # instead of using OFFSET, so deep pages cost the same as the first
+    cursor = request.GET.get('after', '')
+    after_filter = decode_employee_cursor(cursor) if cursor else None
+    if after_filter is not None:
+        employees = employees.filter(after_filter)
+    
+    # Fetch one extra row to know whether there is a next page
+    page = list(employees[:EMPLOYEES_PER_PAGE + 1])
+    has_next = len(page) > EMPLOYEES_PER_PAGE
+    page = page[:EMPLOYEES_PER_PAGE]
+    next_cursor = encode_employee_cursor(page[-1]) if has_next else ''
     
     # Get filter options
     departments = Department.objects.filter(
         branch__company=company
     ).select_related('branch')
     
-    roles = UserRole.choices
+    roles = ROLE_CHOICES
     
     context = {
-        'page_obj': page_obj,
-        'employees': page_obj,
+        'employees': page,
+        'is_first_page': after_filter is None,
+        'next_cursor': next_cursor,
         'departments': departments,
         'roles': roles,
         'search_query': search_query,
         'department_filter': department_filter,
         'role_filter': role_filter,
         'status_filter': status_filter,
-        'total_employees': employees.count(),
+        'total_employees': total_employees,
     }
     
     return render(request, 'users/employee_list.html', context)
 
+@login_required
+@user_passes_test(hr_required)
+def employee_export(request):
+    """Export accessible employees as a streamed CSV file"""
+    user = request.user
+    
+    if not user.company:
+        messages.error(request, 'You must be associated with a company to export employees.')
+        return redirect('dashboard:dashboard')
+    
+    employees = user.get_accessible_employees().order_by('first_name', 'last_name', 'id')
+    role_display = dict(ROLE_CHOICES)
+    
+    def csv_rows():
+        writer = csv.writer(Echo())
+        yield writer.writerow(['ID', 'First Name', 'Last Name', 'Email', 'Role', 'Status'])
+        for row in employee_rows(employees):
+            yield writer.writerow([
+                row['id'],
+                csv_safe(row['first_name']),
+                csv_safe(row['last_name']),
+                csv_safe(row['email']),
+                role_display.get(row['role'], row['role']),
+                'Active' if row['is_active'] else 'Inactive',
+            ])
+    
+    response = StreamingHttpResponse(csv_rows(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="employees.csv"'
+    return response
+
 @login_required
 @user_passes_test(hr_required)
 def employee_detail(request, employee_id):
@@ -127,24 +238,22 @@ def employee_detail(request, employee_id):
     # Get employee from accessible employees based on user's role and branch
     employee = get_object_or_404(
         user.get_accessible_employees().select_related('company', 'profile').prefetch_related(
-            'departmentmembership_set__department__branch',
-            'attendancegroupmembership_set__attendance_group'
+            # Only active memberships are shown, so only those are prefetched
+            Prefetch(
+                'departmentmembership_set',
+                queryset=DepartmentMembership.objects.filter(is_active=True).select_related('department__branch'),
+                to_attr='active_department_memberships'
+            ),
+            Prefetch(
+                'attendancegroupmembership_set',
+                queryset=AttendanceGroupMembership.objects.filter(is_active=True).select_related('attendance_group'),
+                to_attr='active_attendance_memberships'
+            )
         ),
         id=employee_id
     )
     
-    # Get employee's department memberships
-    department_memberships = employee.departmentmembership_set.filter(
-        is_active=True
-    ).select_related('department__branch')
-    
-    # Get employee's attendance groups
-    attendance_memberships = employee.attendancegroupmembership_set.filter(
-        is_active=True
-    ).select_related('attendance_group')
-    
     # Get recent attendance summary (last 30 days)
-    from apps.attendance.models import AttendanceSummary
     thirty_days_ago = timezone.now().date() - timedelta(days=30)
     recent_attendance = AttendanceSummary.objects.filter(
         employee=employee,
@@ -153,8 +262,8 @@ def employee_detail(request, employee_id):
     
     context = {
         'employee': employee,
-        'department_memberships': department_memberships,
-        'attendance_memberships': attendance_memberships,
+        'department_memberships': employee.active_department_memberships,
+        'attendance_memberships': employee.active_attendance_memberships,
         'recent_attendance': recent_attendance,
     }
     
@@ -176,6 +285,24 @@ def employee_create(request):
         messages.error(request, 'HR managers must be assigned to a branch to create employees.')
         return redirect('users:employee_list')
     
+    # Filter departments based on user role
+    if user.role == UserRole.HR_EMPLOYEE and user.managed_branch:
+        # HR managers can only see departments in their assigned branch
+        departments = Department.objects.filter(
+            branch=user.managed_branch
+        ).select_related('branch')
+    else:
+        # Company managers and super admins can see all company departments
+        departments = Department.objects.filter(
+            branch__company=company
+        ).select_related('branch')
+    
+    # Built once and reused by the form and every validation error re-render
+    context = {
+        'departments': departments,
+        'roles': ROLE_CHOICES,
+    }
+    
     if request.method == 'POST':
         try:
             # Get form data
@@ -189,66 +316,64 @@ def employee_create(request):
             # Validate required fields
             if not all([username, email, first_name, last_name]):
                 messages.error(request, 'All fields are required.')
-                return render(request, 'users/employee_create.html', {
-                    'departments': Department.objects.filter(branch__company=company),
-                    'roles': UserRole.choices
-                })
+                return render(request, 'users/employee_create.html', context)
+            
+            # Check if username or email already exists, in one query
+            conflicts = list(User.objects.filter(
+                Q(username=username) | Q(email=email)
+            ).values_list('username', flat=True))
             
-            # Check if username or email already exists
-            if User.objects.filter(username=username).exists():
+            if username in conflicts:
                 messages.error(request, 'Username already exists.')
-                return render(request, 'users/employee_create.html', {
-                    'departments': Department.objects.filter(branch__company=company),
-                    'roles': UserRole.choices
-                })
+                return render(request, 'users/employee_create.html', context)
             
-            if User.objects.filter(email=email).exists():
+            if conflicts:
                 messages.error(request, 'Email already exists.')
-                return render(request, 'users/employee_create.html', {
-                    'departments': Department.objects.filter(branch__company=company),
-                    'roles': UserRole.choices
-                })
+                return render(request, 'users/employee_create.html', context)
             
-            # Create the user
-            employee = User.objects.create_user(
-                username=username,
-                email=email,
-                password='temp123',  # Temporary password
-                first_name=first_name,
-                last_name=last_name,
-                role=role,
-                company=company
-            )
+            # Create the user, profile and membership together so a failure
+            # part way doesn't leave an orphaned user behind
+            with transaction.atomic():
+                # Create the user
+                employee = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password='temp123',  # Temporary password
+                    first_name=first_name,
+                    last_name=last_name,
+                    role=role,
+                    company=company
+                )
             
-            # Create user profile
-            UserProfile.objects.create(
-                user=employee,
-                bio=f'{role.replace("_", " ").title()} at {company.name}',
-                address=request.POST.get('address', ''),
-                emergency_contact_name=request.POST.get('emergency_contact_name', ''),
-                emergency_contact_phone=request.POST.get('emergency_contact_phone', '')
-            )
+                # Create user profile
+                UserProfile.objects.create(
+                    user=employee,
+                    bio=f'{role.replace("_", " ").title()} at {company.name}',
+                    address=request.POST.get('address', ''),
+                    emergency_contact_name=request.POST.get('emergency_contact_name', ''),
+                    emergency_contact_phone=request.POST.get('emergency_contact_phone', '')
+                )
             
-            # Assign to department if specified
-            if department_id:
-                # For HR managers, ensure department is within their branch
-                if user.role == UserRole.HR_EMPLOYEE:
-                    department = get_object_or_404(
-                        Department,
-                        id=department_id,
-                        branch=user.managed_branch
+                # Assign to department if specified
+                if department_id:
+                    # For HR managers, ensure department is within their branch
+                    if user.role == UserRole.HR_EMPLOYEE:
+                        department = get_object_or_404(
+                            Department,
+                            id=department_id,
+                            branch=user.managed_branch
+                        )
+                    else:
+                        department = get_object_or_404(
+                            Department,
+                            id=department_id,
+                            branch__company=company
+                        )
+                    DepartmentMembership.objects.create(
+                        employee=employee,
+                        department=department,
+                        position='member'
                     )
-                else:
-                    department = get_object_or_404(
-                        Department,
-                        id=department_id,
-                        branch__company=company
-                    )
-                DepartmentMembership.objects.create(
-                    employee=employee,
-                    department=department,
-                    position='member'
-                )
             
             messages.success(request, f'Employee {employee.get_full_name()} created successfully!')
             return redirect('users:employee_detail', employee_id=employee.id)
@@ -257,23 +382,6 @@ def employee_create(request):
             messages.error(request, f'Error creating employee: {str(e)}')
     
     # GET request - show form
-    # Filter departments based on user role
-    if user.role == UserRole.HR_EMPLOYEE and user.managed_branch:
-        # HR managers can only see departments in their assigned branch
-        departments = Department.objects.filter(
-            branch=user.managed_branch
-        ).select_related('branch')
-    else:
-        # Company managers and super admins can see all company departments
-        departments = Department.objects.filter(
-            branch__company=company
-        ).select_related('branch')
-    
-    context = {
-        'departments': departments,
-        'roles': UserRole.choices,
-    }
-    
     return render(request, 'users/employee_create.html', context)
 
 @login_required
@@ -301,20 +409,26 @@ def employee_edit(request, employee_id):
                 employee.role = request.POST.get('role', employee.role)
             
             employee.is_active = request.POST.get('is_active') == 'on'
-            employee.save()
+            # Save the user and profile together; the email must stay unique
+            with transaction.atomic():
+                employee.save()
             
-            # Update profile if it exists
-            if hasattr(employee, 'profile'):
-                profile = employee.profile
-                profile.bio = request.POST.get('bio', profile.bio)
-                profile.address = request.POST.get('address', profile.address)
-                profile.emergency_contact_name = request.POST.get('emergency_contact_name', profile.emergency_contact_name)
-                profile.emergency_contact_phone = request.POST.get('emergency_contact_phone', profile.emergency_contact_phone)
-                profile.save()
+                # Update profile if it exists; select_related already loaded it
+                # (or cached its absence), so this never queries
+                profile = getattr(employee, 'profile', None)
+                if profile is not None:
+                    profile.bio = request.POST.get('bio', profile.bio)
+                    profile.address = request.POST.get('address', profile.address)
+                    profile.emergency_contact_name = request.POST.get('emergency_contact_name', profile.emergency_contact_name)
+                    profile.emergency_contact_phone = request.POST.get('emergency_contact_phone', profile.emergency_contact_phone)
+                    profile.save()
             
             messages.success(request, f'Employee {employee.get_full_name()} updated successfully!')
             return redirect('users:employee_detail', employee_id=employee.id)
             
+        except IntegrityError:
+            employee.refresh_from_db()
+            messages.error(request, 'This email address is already in use.')
         except Exception as e:
             messages.error(request, f'Error updating employee: {str(e)}')
     
@@ -323,16 +437,19 @@ def employee_edit(request, employee_id):
         branch__company=company
     ).select_related('branch')
     
-    current_department = None
-    dept_membership = employee.departmentmembership_set.filter(is_active=True).first()
-    if dept_membership:
-        current_department = dept_membership.department
+    # Load the active membership with its department and branch in one query
+    prefetch_related_objects([employee], Prefetch(
+        'departmentmembership_set',
+        queryset=DepartmentMembership.objects.filter(is_active=True).select_related('department__branch'),
+        to_attr='active_memberships'
+    ))
+    current_department = employee.active_memberships[0].department if employee.active_memberships else None
     
     context = {
         'employee': employee,
         'departments': departments,
         'current_department': current_department,
-        'roles': UserRole.choices,
+        'roles': ROLE_CHOICES,
     }
     
     return render(request, 'users/employee_edit.html', context)
@@ -356,13 +473,12 @@ def employee_delete(request, employee_id):
         messages.error(request, 'You cannot delete your own account.')
         return redirect('users:employee_list')
     
-    # Soft delete - deactivate the user
-    employee.is_active = False
-    employee.save()
-    
-    # Deactivate all memberships
-    employee.departmentmembership_set.update(is_active=False)
-    employee.attendancegroupmembership_set.update(is_active=False)
+    # Soft delete - deactivate the user and all memberships together; update()
+    # writes only these columns and skips auto_now, so updated_at is set here
+    with transaction.atomic():
+        User.objects.filter(pk=employee.pk).update(is_active=False, updated_at=timezone.now())
+        employee.departmentmembership_set.update(is_active=False)
+        employee.attendancegroupmembership_set.update(is_active=False)
     
     messages.success(request, f'Employee {employee.get_full_name()} has been deactivated.')
     return redirect('users:employee_list')
@@ -378,19 +494,24 @@ def department_management(request):
         messages.error(request, 'You must be associated with a company.')
         return redirect('dashboard:dashboard')
     
-    # Get all departments in the company
+    # Get all departments in the company with only the active memberships the
+    # page lists; their member counts come from the same prefetched lists
     departments = Department.objects.filter(
         branch__company=company
     ).select_related('branch').prefetch_related(
-        'departmentmembership_set__employee'
+        Prefetch(
+            'departmentmembership_set',
+            queryset=DepartmentMembership.objects.filter(is_active=True).select_related('employee'),
+            to_attr='active_memberships'
+        )
     )
     
-    # Get employees without department assignments
+    # Get employees without department assignments (NOT EXISTS anti-join)
     unassigned_employees = User.objects.filter(
         company=company,
         is_active=True
-    ).exclude(
-        departmentmembership__is_active=True
+    ).filter(
+        ~Exists(DepartmentMembership.objects.filter(employee=OuterRef('pk'), is_active=True))
     )
     
     context = {
@@ -87,6 +87,18 @@ DATABASES = {
     }
 }
 
+# Cache
+# Dashboard statistics and recent check-ins are cached and invalidated by
+# check-in signals, so every worker process must share one cache. The
+# per-process default (LocMemCache) would leave other workers serving stale
+# numbers. Create the table with: python manage.py createcachetable
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
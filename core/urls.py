@@ -21,12 +21,13 @@ from django.conf.urls.static import static
 from django.shortcuts import redirect
 from django.contrib.auth import views as auth_views
 from apps.users.auth_views import CustomLoginView
+from apps.users.models import UserRole
 
 # Redirect root based on user role
 def root_redirect(request):
     if request.user.is_authenticated:
         # Redirect employees to check-in, others to dashboard
-        if request.user.role == 'EMPLOYEE':
+        if request.user.role == UserRole.EMPLOYEE:
             return redirect('attendance:check_in')
         return redirect('dashboard:dashboard')
     return redirect('login')
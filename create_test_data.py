@@ -11,125 +11,138 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from apps.users.models import UserRole, UserProfile
 from apps.companies.models import Company, Branch, Department
-from apps.attendance.models import AttendanceGroup, Period
+from apps.attendance.models import AttendanceGroup, AttendanceGroupMembership, Period
 from datetime import time
 
 User = get_user_model()
 
+@transaction.atomic
 def create_test_data():
     print("Creating test data for SaaS Attendance Platform...")
     
+    # Both test accounts share a password, so hash it once up front
+    test_password = make_password('test123')
+    
     # Create a test company owner
-    if not User.objects.filter(username='testowner').exists():
-        owner = User.objects.create_user(
-            username='testowner',
-            email='owner@testcompany.com',
-            password='test123',
-            first_name='Test',
-            last_name='Owner',
-            role=UserRole.COMPANY_MANAGER
-        )
+    owner, created = User.objects.get_or_create(
+        username='testowner',
+        defaults={
+            'email': 'owner@testcompany.com',
+            'first_name': 'Test',
+            'last_name': 'Owner',
+            'role': UserRole.COMPANY_MANAGER,
+            'password': test_password,
+        }
+    )
+    if created:
         print(f"[+] Created company owner: {owner.username}")
     else:
-        owner = User.objects.get(username='testowner')
         print(f"[+] Company owner already exists: {owner.username}")
     
     # Create a test company
-    if not Company.objects.filter(name='Test Company Ltd').exists():
-        company = Company.objects.create(
-            name='Test Company Ltd',
-            description='A test company for demonstration',
-            website='https://testcompany.com',
-            owner=owner
-        )
+    company, created = Company.objects.get_or_create(
+        name='Test Company Ltd',
+        defaults={
+            'description': 'A test company for demonstration',
+            'website': 'https://testcompany.com',
+            'owner': owner,
+        }
+    )
+    if created:
         owner.company = company
         owner.save()
         print(f"[+] Created company: {company.name}")
     else:
-        company = Company.objects.get(name='Test Company Ltd')
         print(f"[+] Company already exists: {company.name}")
     
     # Create owner profile
-    if not hasattr(owner, 'profile'):
-        UserProfile.objects.create(
-            user=owner,
-            bio='Company Owner and Manager',
-            address='123 Business Street, Tech City'
-        )
+    _, created = UserProfile.objects.get_or_create(
+        user=owner,
+        defaults={
+            'bio': 'Company Owner and Manager',
+            'address': '123 Business Street, Tech City',
+        }
+    )
+    if created:
         print(f"[+] Created profile for: {owner.username}")
     
     # Create a test branch
-    if not Branch.objects.filter(name='Main Office', company=company).exists():
-        branch = Branch.objects.create(
-            name='Main Office',
-            company=company,
-            address='123 Business Street, Tech City',
-            latitude=40.7128,  # New York coordinates for demo
-            longitude=-74.0060
-        )
+    branch, created = Branch.objects.get_or_create(
+        name='Main Office',
+        company=company,
+        defaults={
+            'address': '123 Business Street, Tech City',
+            'latitude': 40.7128,  # New York coordinates for demo
+            'longitude': -74.0060,
+        }
+    )
+    if created:
         print(f"[+] Created branch: {branch.name}")
     else:
-        branch = Branch.objects.get(name='Main Office', company=company)
         print(f"[+] Branch already exists: {branch.name}")
     
     # Create a test department
-    if not Department.objects.filter(name='Engineering', branch=branch).exists():
-        department = Department.objects.create(
-            name='Engineering',
-            branch=branch,
-            description='Software Engineering Department'
-        )
+    department, created = Department.objects.get_or_create(
+        name='Engineering',
+        branch=branch,
+        defaults={'description': 'Software Engineering Department'}
+    )
+    if created:
         print(f"[+] Created department: {department.name}")
     else:
-        department = Department.objects.get(name='Engineering', branch=branch)
         print(f"[+] Department already exists: {department.name}")
     
     # Create an attendance group
-    if not AttendanceGroup.objects.filter(name='Engineering Team', company=company).exists():
-        attendance_group = AttendanceGroup.objects.create(
-            name='Engineering Team',
-            company=company,
-            branch=branch,
-            latitude=40.7128,
-            longitude=-74.0060,
-            radius=100,
-            description='Main engineering team attendance group'
-        )
+    attendance_group, created = AttendanceGroup.objects.get_or_create(
+        name='Engineering Team',
+        company=company,
+        defaults={
+            'branch': branch,
+            'latitude': 40.7128,
+            'longitude': -74.0060,
+            'radius': 100,
+            'description': 'Main engineering team attendance group',
+        }
+    )
+    if created:
         print(f"[+] Created attendance group: {attendance_group.name}")
     else:
-        attendance_group = AttendanceGroup.objects.get(name='Engineering Team', company=company)
         print(f"[+] Attendance group already exists: {attendance_group.name}")
     
     # Create a work period
-    if not Period.objects.filter(name='Standard Hours', group=attendance_group).exists():
-        period = Period.objects.create(
-            name='Standard Hours',
-            group=attendance_group,
-            start_time=time(9, 0),  # 9:00 AM
-            end_time=time(17, 0),   # 5:00 PM
-            weekdays='1,2,3,4,5',   # Monday to Friday
-            late_checkin_grace_minutes=15,
-            early_checkout_grace_minutes=15
-        )
+    period, created = Period.objects.get_or_create(
+        name='Standard Hours',
+        group=attendance_group,
+        defaults={
+            'start_time': time(9, 0),  # 9:00 AM
+            'end_time': time(17, 0),   # 5:00 PM
+            'weekdays': '1,2,3,4,5',   # Monday to Friday
+            'late_checkin_grace_minutes': 15,
+            'early_checkout_grace_minutes': 15,
+        }
+    )
+    if created:
         print(f"[+] Created work period: {period.name}")
     else:
-        period = Period.objects.get(name='Standard Hours', group=attendance_group)
         print(f"[+] Work period already exists: {period.name}")
     
     # Create a test employee
-    if not User.objects.filter(username='testemployee').exists():
-        employee = User.objects.create_user(
-            username='testemployee',
-            email='employee@testcompany.com',
-            password='test123',
-            first_name='Test',
-            last_name='Employee',
-            role=UserRole.EMPLOYEE,
-            company=company
-        )
-        
+    employee, created = User.objects.get_or_create(
+        username='testemployee',
+        defaults={
+            'email': 'employee@testcompany.com',
+            'first_name': 'Test',
+            'last_name': 'Employee',
+            'role': UserRole.EMPLOYEE,
+            'company': company,
+            'password': test_password,
+        }
+    )
+    if created:
         # Create employee profile
         UserProfile.objects.create(
             user=employee,
@@ -138,7 +151,6 @@ def create_test_data():
         )
         
         # Add employee to attendance group
-        from apps.attendance.models import AttendanceGroupMembership
         AttendanceGroupMembership.objects.create(
             employee=employee,
             attendance_group=attendance_group,
@@ -147,7 +159,6 @@ def create_test_data():
         
         print(f"[+] Created employee: {employee.username}")
     else:
-        employee = User.objects.get(username='testemployee')
         print(f"[+] Employee already exists: {employee.username}")
     
     print("\n[SUCCESS] Test data creation completed!")
@@ -8,7 +8,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
 from apps.attendance.models import CheckIn
-from collections import defaultdict
+from collections import Counter
 
 def verify_timestamps():
     print("Verifying attendance record timestamps...")
@@ -17,16 +17,18 @@ def verify_timestamps():
     # Get all check-in records
     checkins = CheckIn.objects.all().order_by('timestamp')
     
-    if not checkins.exists():
+    # Read the timestamps in a single scan instead of loading full records
+    timestamps = list(checkins.values_list('timestamp', flat=True))
+    total = len(timestamps)
+    
+    if not total:
         print("No check-in records found!")
         return
     
-    print(f"Total check-in records: {checkins.count()}")
+    print(f"Total check-in records: {total}")
     
     # Group by date
-    dates = defaultdict(int)
-    for checkin in checkins:
-        dates[checkin.timestamp.date()] += 1
+    dates = Counter(timestamp.date() for timestamp in timestamps)
     
     print(f"\nRecords distributed across {len(dates)} different dates:")
     print("-" * 50)
@@ -42,23 +44,21 @@ def verify_timestamps():
     print(f"\nSample records with timestamps:")
     print("-" * 50)
     
-    sample_records = checkins[:10]
+    sample_records = checkins.select_related('employee')[:10]
     for checkin in sample_records:
         print(f"{checkin.employee.username}: {checkin.get_type_display()} at {checkin.timestamp.strftime('%Y-%m-%d %H:%M:%S')} ({checkin.get_status_display()})")
     
     # Check if timestamps are realistic (not all the same)
-    unique_timestamps = set(checkin.timestamp for checkin in checkins)
-    print(f"\nTimestamp diversity: {len(unique_timestamps)} unique timestamps out of {checkins.count()} records")
+    unique_timestamps = set(timestamps)
+    print(f"\nTimestamp diversity: {len(unique_timestamps)} unique timestamps out of {total} records")
     
-    if len(unique_timestamps) > checkins.count() * 0.8:  # At least 80% unique
+    if len(unique_timestamps) > total * 0.8:  # At least 80% unique
         print("✅ PASS: Timestamps are properly distributed and realistic!")
     else:
         print("❌ FAIL: Timestamps appear to be too similar or not properly distributed")
     
     # Show date range
-    first_record = checkins.first()
-    last_record = checkins.last()
-    print(f"\nDate range: {first_record.timestamp.date()} to {last_record.timestamp.date()}")
+    print(f"\nDate range: {timestamps[0].date()} to {timestamps[-1].date()}")
 
 if __name__ == "__main__":
     verify_timestamps()